@@ -42,27 +42,37 @@ print(f"Volume path ready: {volume_path}")
 
 # COMMAND ----------
 
-import os
+import copy
 import io
-import random
-import math
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
 
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-    PageBreak, HRFlowable
-)
+from reportlab.pdfgen import canvas
+from reportlab.platypus import Paragraph, Spacer, Table, TableStyle, HRFlowable, LayoutError
 from reportlab.graphics.shapes import Drawing, Rect, Circle, Line, String
 from reportlab.lib.enums import TA_CENTER
+from reportlab.pdfbase import pdfmetrics
+
+# reportlab 4.x ships its C accelerator as the separate `rl_accel` package
+# (imported as `_rl_accel`); without it reportlab falls back to pure Python.
+try:
+    import _rl_accel  # noqa: F401
+except ImportError:
+    print("WARNING: rl_accel is not installed; reportlab will use its pure-Python fallbacks")
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 NUM_DOCS = 10
+# One Spark task generates a slice of documents; capped so large corpora don't explode the task count
+NUM_PARTITIONS = min(NUM_DOCS, 64)
+WRITE_THREADS = 4  # per-task threads for volume writes
 
 MANUFACTURERS = [
     "Siemens Industrial Systems", "ABB Power Solutions", "Schneider Electric",
@@ -105,6 +115,37 @@ GDT_TOLERANCE_TYPES = [
 
 DATUM_REFS = ["A", "B", "C", "A|B", "A|B|C", "B|C"]
 
+_ASTM_GRADES = ("ASTM A36", "ASTM A572", "ASTM B209", "ASTM B152", "ASTM D3935")
+
+_VOLTAGES = ("120V AC", "240V AC", "480V AC", "24V DC", "48V DC", "600V AC")
+_TEMP_MINS = (-40, -25, -20, -10, 0)
+_TEMP_MAXS = (50, 55, 60, 70, 85)
+
+_FEATURES = (
+    "Mounting Surface A", "Bore Diameter", "Shaft Centerline", "Face Plate",
+    "Terminal Block Surface", "Conduit Hub", "DIN Rail Channel",
+    "Heat Sink Fins", "Cover Plate", "Gasket Groove", "Cable Entry Port",
+    "Enclosure Corner Radius"
+)
+
+_COMPONENTS = (
+    "Enclosure Body", "Cover Plate", "Terminal Block", "Mounting Bracket",
+    "Heat Sink", "Bus Bar", "DIN Rail", "Gasket", "Cable Gland", "Internal Bracket"
+)
+
+# Table header rows
+_GENERAL_HEADER = ("Field", "Value")
+_GDT_HEADER = ("Feature", "Tolerance Type", "Symbol", "Value", "Datum Ref", "Status")
+_MAT_HEADER = ("Component", "Material", "Grade/Spec", "Thickness (mm)", "Hardness")
+_TEST_HEADER = ("Test Name", "Measured Value", "Threshold", "Result")
+
+# IDs keep their dashes in the report body; filenames use underscores
+_FILENAME_TRANSLATION = str.maketrans("-", "_")
+
+# Outcome probabilities, drawn with a single uniform sample each
+_ROW_PASS_RATE = 0.9   # GD&T features and individual tests
+_CERT_PASS_RATE = 0.8  # overall certification: PASS, otherwise CONDITIONAL
+
 TEST_NAMES = [
     "Dielectric Withstand Test", "Insulation Resistance Test",
     "Ground Continuity Test", "Short-Circuit Current Rating Test",
@@ -115,21 +156,159 @@ TEST_NAMES = [
     "Arc Flash Hazard Test", "IP Enclosure Integrity Test"
 ]
 
+# ---------------------------------------------------------------------------
+# Document styling — identical for every PDF, so built once at import time
+# ---------------------------------------------------------------------------
+_COLOR_NAVY = colors.HexColor('#1a3a5c')
+_COLOR_SLATE = colors.HexColor('#4a6a8c')
+_COLOR_RED = colors.HexColor('#c41230')
+_COLOR_GREY_CELL = colors.HexColor('#f5f7fa')
+_COLOR_GRID = colors.HexColor('#cccccc')
+_COLOR_PASS_GREEN = colors.HexColor('#228B22')
+
+# Content box: 0.75" page margins plus reportlab's standard 6pt frame padding
+_PAGE_WIDTH, _PAGE_HEIGHT = letter
+_CONTENT_LEFT = 0.75 * inch + 6
+_CONTENT_TOP = _PAGE_HEIGHT - 0.75 * inch - 6
+_CONTENT_BOTTOM = 0.75 * inch + 6
+_CONTENT_WIDTH = _PAGE_WIDTH - 2 * (0.75 * inch + 6)
+
+_STYLES = getSampleStyleSheet()
+_BANNER_STYLE = ParagraphStyle('UL', parent=_STYLES['Title'], fontSize=28, textColor=_COLOR_RED,
+                               alignment=TA_CENTER)
+_TITLE_STYLE = ParagraphStyle('Title2', parent=_STYLES['Title'], fontSize=18, spaceAfter=6,
+                              textColor=_COLOR_NAVY)
+_SUBTITLE_STYLE = ParagraphStyle('Subtitle2', parent=_STYLES['Normal'], fontSize=12, spaceAfter=12,
+                                 textColor=_COLOR_SLATE, alignment=TA_CENTER)
+_HEADING_STYLE = ParagraphStyle('Heading2', parent=_STYLES['Heading2'], fontSize=14, spaceBefore=16,
+                                spaceAfter=8, textColor=_COLOR_NAVY)
+_BODY_STYLE = ParagraphStyle('Body2', parent=_STYLES['Normal'], fontSize=10, spaceAfter=8, leading=14)
+_SMALL_STYLE = ParagraphStyle('Small', parent=_STYLES['Normal'], fontSize=8, textColor=colors.gray)
+
+_REPORT_FONTS = ("Helvetica", "Helvetica-Bold")
+
+
+def _warm_fonts():
+    """Load the standard-font AFM metrics up front so the first PDF isn't slower than the rest."""
+    for font_name in _REPORT_FONTS:
+        pdfmetrics.getFont(font_name)
+        pdfmetrics.stringWidth("warmup", font_name, 10)
+
+
+_warm_fonts()
+
+# Header + grid + zebra shared by every table; each table appends only what differs
+_BASE_TABLE_CMDS = [
+    ('BACKGROUND', (0, 0), (-1, 0), _COLOR_NAVY),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('GRID', (0, 0), (-1, -1), 0.5, _COLOR_GRID),
+    ('BACKGROUND', (0, 1), (-1, -1), _COLOR_GREY_CELL),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+    ('TOPPADDING', (0, 0), (-1, -1), 4),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+]
 
-def random_model_number(prefix):
-    return f"{prefix}-{random.randint(1000, 9999)}-{random.choice('ABCDEFGH')}{random.randint(1, 9)}"
+_GENERAL_TABLE_STYLE = TableStyle(_BASE_TABLE_CMDS + [
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('LEFTPADDING', (0, 0), (-1, -1), 8),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 8),
+    ('TOPPADDING', (0, 0), (-1, -1), 5),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
+])
 
+_GDT_TABLE_STYLE = TableStyle(_BASE_TABLE_CMDS + [
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('ALIGN', (2, 0), (2, -1), 'CENTER'),
+    ('ALIGN', (5, 0), (5, -1), 'CENTER'),
+])
 
-def random_cert_id():
-    return f"UL-{random.randint(2024, 2026)}-{random.randint(100000, 999999)}"
+_MAT_TABLE_STYLE = TableStyle(_BASE_TABLE_CMDS + [
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+])
 
+_TEST_TABLE_STYLE = TableStyle(_BASE_TABLE_CMDS + [
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('ALIGN', (3, 0), (3, -1), 'CENTER'),
+])
 
-def random_tolerance():
-    val = round(random.uniform(0.001, 0.250), 3)
-    return f"±{val} mm"
 
+def _pick(rng, seq):
+    return seq[rng.integers(len(seq))]
 
-def create_gdt_drawing(width=400, height=250):
+
+def _scale_int(u, lo, hi):
+    """Map a uniform [0, 1) draw onto the inclusive integer range [lo, hi]."""
+    return lo + int(u * (hi - lo + 1))
+
+
+def _scale_float(u, lo, hi, ndigits):
+    return round(lo + u * (hi - lo), ndigits)
+
+
+def _scale_pick(u, seq):
+    return seq[int(u * len(seq))]
+
+
+# (measured, threshold) formatters per test, each fed three uniform draws
+_TEST_MEASUREMENTS = {
+    "Dielectric Withstand Test": lambda u0, u1, u2: (
+        f"{_scale_int(u0, 1800, 2500)} VAC", "≥ 1500 VAC"),
+    "Insulation Resistance Test": lambda u0, u1, u2: (
+        f"{_scale_int(u0, 80, 500)} MΩ", "≥ 50 MΩ"),
+    "Ground Continuity Test": lambda u0, u1, u2: (
+        f"{_scale_float(u0, 0.01, 0.15, 3)} Ω", "≤ 0.1 Ω"),
+    "Temperature Rise Test": lambda u0, u1, u2: (
+        f"{_scale_int(u0, 35, 75)}°C rise", f"≤ {_scale_pick(u1, (65, 70, 75))}°C rise"),
+    "Vibration Endurance Test": lambda u0, u1, u2: (
+        f"{_scale_float(u0, 0.5, 5.0, 1)}g @ {_scale_int(u1, 10, 500)} Hz",
+        f"≤ {_scale_float(u2, 3.0, 10.0, 1)}g"),
+    "Salt Spray Corrosion Test": lambda u0, u1, u2: (
+        f"{_scale_int(u0, 200, 1000)} hours", f"≥ {_scale_pick(u1, (200, 500, 720))} hours"),
+    "Humidity Resistance Test": lambda u0, u1, u2: (
+        f"{_scale_int(u0, 85, 98)}% RH, {_scale_int(u1, 24, 168)}h", "95% RH, 48h min"),
+    "Short-Circuit Current Rating Test": lambda u0, u1, u2: (
+        f"{_scale_int(u0, 10, 100)} kA", f"≥ {_scale_pick(u1, (10, 25, 50))} kA"),
+    "Thermal Shock Test": lambda u0, u1, u2: (
+        f"-{_scale_int(u0, 20, 40)}°C to +{_scale_int(u1, 60, 85)}°C",
+        f"-40°C to +{_scale_pick(u2, (70, 85))}°C"),
+}
+
+
+def _generic_measurement(u0, u1, u2):
+    return f"{_scale_float(u0, 0.1, 100.0, 2)} units", f"≤ {_scale_float(u1, 50, 200, 1)} units"
+
+
+def random_model_number(prefix, rng):
+    return f"{prefix}-{rng.integers(1000, 10000)}-{_pick(rng, 'ABCDEFGH')}{rng.integers(1, 10)}"
+
+
+def random_cert_id(rng):
+    return f"UL-{rng.integers(2024, 2027)}-{rng.integers(100000, 1000000)}"
+
+
+def _clone_drawing(template):
+    """Shallow-copy a template Drawing so per-document shapes can be added without touching it."""
+    d = copy.copy(template)
+    d.contents = list(template.contents)
+    return d
+
+
+# Template Drawings keyed by (builder, width, height). A plain dict rather than
+# functools.lru_cache: cloudpickle ships __main__ functions and globals by value,
+# but pickles an lru_cache wrapper by name, which executors cannot resolve.
+_TEMPLATE_CACHE = {}
+
+
+def _template(builder, width, height):
+    key = (builder.__name__, width, height)
+    if key not in _TEMPLATE_CACHE:
+        _TEMPLATE_CACHE[key] = builder(width, height)
+    return _TEMPLATE_CACHE[key]
+
+
+def _gdt_template(width, height):
     d = Drawing(width, height)
     d.add(Rect(0, 0, width, height, fillColor=colors.white, strokeColor=colors.black, strokeWidth=1))
     cx, cy = width / 2, height / 2
@@ -164,7 +343,12 @@ def create_gdt_drawing(width=400, height=250):
     return d
 
 
-def create_equipment_diagram(width=400, height=200, eq_type=""):
+def create_gdt_drawing(width=400, height=250):
+    # The GD&T cross-section is identical in every report
+    return _clone_drawing(_template(_gdt_template, width, height))
+
+
+def _equipment_diagram_template(width, height):
     d = Drawing(width, height)
     d.add(Rect(0, 0, width, height, fillColor=colors.white, strokeColor=colors.black, strokeWidth=1))
     d.add(Rect(50, 30, 300, 140, fillColor=colors.Color(0.9, 0.93, 0.96),
@@ -183,65 +367,86 @@ def create_equipment_diagram(width=400, height=200, eq_type=""):
     d.add(String(275, 108, "PANEL", fontSize=8, fillColor=colors.black))
     d.add(Line(150, 125, 170, 125, strokeColor=colors.red, strokeWidth=1.5))
     d.add(Line(250, 125, 270, 125, strokeColor=colors.red, strokeWidth=1.5))
-    for i in range(4):
+    d.add(String(60, 37, "STATUS INDICATORS", fontSize=6, fillColor=colors.gray))
+    return d
+
+
+def create_equipment_diagram(rng, width=400, height=200, eq_type=""):
+    # Only the status LEDs and the equipment type label vary per document
+    d = _clone_drawing(_template(_equipment_diagram_template, width, height))
+    led_colors = (colors.green, colors.red, colors.yellow)
+    for i, c in enumerate(rng.integers(0, len(led_colors), 4)):
         d.add(Circle(80 + i * 25, 55, 5,
-                     fillColor=random.choice([colors.green, colors.red, colors.yellow]),
+                     fillColor=led_colors[c],
                      strokeColor=colors.black, strokeWidth=0.5))
     d.add(String(60, 160, eq_type, fontSize=9, fillColor=colors.black))
-    d.add(String(60, 37, "STATUS INDICATORS", fontSize=6, fillColor=colors.gray))
     return d
 
 
-def generate_equipment_pdf(doc_index):
-    eq_type_name, eq_prefix = random.choice(EQUIPMENT_TYPES)
-    manufacturer = random.choice(MANUFACTURERS)
-    model = random_model_number(eq_prefix)
-    cert_id = random_cert_id()
-    material = random.choice(MATERIALS)
-    safety = random.choice(SAFETY_RATINGS)
-    ip = random.choice(IP_RATINGS)
-    standards = ", ".join(random.sample(COMPLIANCE_STANDARDS, k=random.randint(3, 5)))
-    weight = round(random.uniform(2.5, 150.0), 1)
-    voltage = random.choice(["120V AC", "240V AC", "480V AC", "24V DC", "48V DC", "600V AC"])
-    temp_min = random.choice([-40, -25, -20, -10, 0])
-    temp_max = random.choice([50, 55, 60, 70, 85])
-    cert_status = random.choices(["PASS", "CONDITIONAL", "PASS", "PASS"], weights=[6, 2, 1, 1])[0]
-
-    filename = f"UL_Cert_{cert_id.replace('-', '_')}_{model.replace('-', '_')}.pdf"
+def _draw_page(c, flowables):
+    """Stack flowables top-down on the current page and finish it.
+
+    Every report has a fixed four-page layout, so this skips Platypus's document
+    template and frame machinery (no splitting) and only reproduces its vertical
+    spacing rules. A flowable that would run past the bottom margin raises
+    LayoutError, as a full Platypus frame would, rather than drawing off the page.
+    """
+    y = _CONTENT_TOP
+    prev_space_after = None
+    for f in flowables:
+        space_before = 0 if prev_space_after is None else max(f.getSpaceBefore() - prev_space_after, 0)
+        w, h = f.wrapOn(c, _CONTENT_WIDTH, y - space_before)
+        y -= space_before + h
+        if y < _CONTENT_BOTTOM:
+            raise LayoutError(f"{type(f).__name__} overflows the page by {_CONTENT_BOTTOM - y:.1f}pt")
+        f.drawOn(c, _CONTENT_LEFT, y, _sW=_CONTENT_WIDTH - w)
+        prev_space_after = f.getSpaceAfter()
+        y -= prev_space_after
+    c.showPage()
+
 
+def generate_equipment_pdf(doc_index):
+    # One generator per document, seeded by its index, so output is reproducible
+    # regardless of which worker generates it
+    rng = np.random.default_rng(doc_index)
+
+    eq_type_name, eq_prefix = _pick(rng, EQUIPMENT_TYPES)
+    manufacturer = _pick(rng, MANUFACTURERS)
+    model = random_model_number(eq_prefix, rng)
+    cert_id = random_cert_id(rng)
+    material = _pick(rng, MATERIALS)
+    safety = _pick(rng, SAFETY_RATINGS)
+    ip = _pick(rng, IP_RATINGS)
+    std_idx = rng.choice(len(COMPLIANCE_STANDARDS), size=rng.integers(3, 6), replace=False)
+    standards = ", ".join(COMPLIANCE_STANDARDS[j] for j in std_idx)
+    weight = round(rng.uniform(2.5, 150.0), 1)
+    voltage = _pick(rng, _VOLTAGES)
+    temp_min = _pick(rng, _TEMP_MINS)
+    temp_max = _pick(rng, _TEMP_MAXS)
+    cert_status = "PASS" if rng.random() < _CERT_PASS_RATE else "CONDITIONAL"
+
+    filename = f"UL_Cert_{cert_id}_{model}.pdf".translate(_FILENAME_TRANSLATION)
+
+    # Build into an explicit in-memory buffer: the bytes are handed to the caller's
+    # write pool so the volume write overlaps with generating the next document
     pdf_buffer = io.BytesIO()
-    doc = SimpleDocTemplate(
-        pdf_buffer, pagesize=letter,
-        leftMargin=0.75 * inch, rightMargin=0.75 * inch,
-        topMargin=0.75 * inch, bottomMargin=0.75 * inch
-    )
-
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle('Title2', parent=styles['Title'], fontSize=18, spaceAfter=6,
-                                  textColor=colors.HexColor('#1a3a5c'))
-    subtitle_style = ParagraphStyle('Subtitle2', parent=styles['Normal'], fontSize=12, spaceAfter=12,
-                                     textColor=colors.HexColor('#4a6a8c'), alignment=TA_CENTER)
-    heading_style = ParagraphStyle('Heading2', parent=styles['Heading2'], fontSize=14, spaceBefore=16,
-                                    spaceAfter=8, textColor=colors.HexColor('#1a3a5c'))
-    body_style = ParagraphStyle('Body2', parent=styles['Normal'], fontSize=10, spaceAfter=8, leading=14)
-    small_style = ParagraphStyle('Small', parent=styles['Normal'], fontSize=8, textColor=colors.gray)
+    c = canvas.Canvas(pdf_buffer, pagesize=letter)
 
     story = []
 
     # Page 1: Cover & General Info
     story.append(Spacer(1, 0.3 * inch))
-    story.append(Paragraph("UL SOLUTIONS", ParagraphStyle('UL', parent=styles['Title'],
-                            fontSize=28, textColor=colors.HexColor('#c41230'), alignment=TA_CENTER)))
-    story.append(Paragraph("Equipment Certification Report", title_style))
-    story.append(HRFlowable(width="100%", thickness=2, color=colors.HexColor('#c41230')))
+    story.append(Paragraph("UL SOLUTIONS", _BANNER_STYLE))
+    story.append(Paragraph("Equipment Certification Report", _TITLE_STYLE))
+    story.append(HRFlowable(width="100%", thickness=2, color=_COLOR_RED))
     story.append(Spacer(1, 0.2 * inch))
-    story.append(Paragraph(f"Certification ID: <b>{cert_id}</b>", subtitle_style))
-    story.append(Paragraph(f"{eq_type_name} — Model {model}", subtitle_style))
-    story.append(Paragraph(f"Manufacturer: {manufacturer}", subtitle_style))
+    story.append(Paragraph(f"Certification ID: <b>{cert_id}</b>", _SUBTITLE_STYLE))
+    story.append(Paragraph(f"{eq_type_name} — Model {model}", _SUBTITLE_STYLE))
+    story.append(Paragraph(f"Manufacturer: {manufacturer}", _SUBTITLE_STYLE))
     story.append(Spacer(1, 0.3 * inch))
 
     general_data = [
-        ["Field", "Value"],
+        _GENERAL_HEADER,
         ["Equipment Type", eq_type_name],
         ["Model Number", model],
         ["Manufacturer", manufacturer],
@@ -254,192 +459,122 @@ def generate_equipment_pdf(doc_index):
         ["Weight", f"{weight} kg"],
         ["Voltage Rating", voltage],
         ["Operating Temp Range", f"{temp_min}°C to {temp_max}°C"],
-        ["Report Date", f"2026-{random.randint(1,2):02d}-{random.randint(1,28):02d}"],
+        ["Report Date", f"2026-{rng.integers(1, 3):02d}-{rng.integers(1, 29):02d}"],
     ]
     t = Table(general_data, colWidths=[2.5 * inch, 4.5 * inch])
-    t.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a3a5c')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f5f7fa')),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#cccccc')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 5),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
-    ]))
+    t.setStyle(_GENERAL_TABLE_STYLE)
     story.append(t)
-    story.append(PageBreak())
+    _draw_page(c, story)
+    story = []
 
     # Page 2: Equipment Diagram & GD&T Drawing
-    story.append(Paragraph("2. Equipment Overview & Engineering Drawings", heading_style))
+    story.append(Paragraph("2. Equipment Overview & Engineering Drawings", _HEADING_STYLE))
     story.append(Paragraph(
         f"The {eq_type_name} model {model} manufactured by {manufacturer} is designed for "
         f"industrial applications requiring {voltage} power supply with {ip} environmental protection. "
         f"The unit is constructed primarily from {material} with a total weight of {weight} kg.",
-        body_style
+        _BODY_STYLE
     ))
     story.append(Spacer(1, 0.15 * inch))
-    story.append(Paragraph("<b>Figure 1: Equipment Block Diagram</b>", body_style))
-    story.append(create_equipment_diagram(450, 180, eq_type_name))
+    story.append(Paragraph("<b>Figure 1: Equipment Block Diagram</b>", _BODY_STYLE))
+    story.append(create_equipment_diagram(rng, 450, 180, eq_type_name))
     story.append(Spacer(1, 0.2 * inch))
-    story.append(Paragraph("<b>Figure 2: GD&T Cross-Section Drawing</b>", body_style))
+    story.append(Paragraph("<b>Figure 2: GD&T Cross-Section Drawing</b>", _BODY_STYLE))
     story.append(create_gdt_drawing(450, 230))
     story.append(Spacer(1, 0.15 * inch))
     story.append(Paragraph(
         "All dimensions are in millimeters per ASME Y14.5-2018 standard. "
         "Third-angle projection is used throughout.",
-        body_style
+        _BODY_STYLE
     ))
-    story.append(PageBreak())
+    _draw_page(c, story)
+    story = []
 
     # Page 3: GD&T Specifications
-    story.append(Paragraph("3. Geometric Dimensioning & Tolerancing (GD&T)", heading_style))
+    story.append(Paragraph("3. Geometric Dimensioning & Tolerancing (GD&T)", _HEADING_STYLE))
     story.append(Paragraph(
         "The following GD&T specifications apply to critical features of the equipment "
         "housing and mounting interfaces per ASME Y14.5-2018.",
-        body_style
+        _BODY_STYLE
     ))
 
-    num_gdt = random.randint(6, 10)
-    gdt_data = [["Feature", "Tolerance Type", "Symbol", "Value", "Datum Ref", "Status"]]
-    features = [
-        "Mounting Surface A", "Bore Diameter", "Shaft Centerline", "Face Plate",
-        "Terminal Block Surface", "Conduit Hub", "DIN Rail Channel",
-        "Heat Sink Fins", "Cover Plate", "Gasket Groove", "Cable Entry Port",
-        "Enclosure Corner Radius"
-    ]
-    for _ in range(num_gdt):
-        tol_type, symbol = random.choice(GDT_TOLERANCE_TYPES)
-        status = random.choices(["PASS", "FAIL"], weights=[9, 1])[0]
+    num_gdt = int(rng.integers(6, 11))
+    gdt_data = [_GDT_HEADER]
+    tol_idx = rng.integers(0, len(GDT_TOLERANCE_TYPES), num_gdt)
+    feat_idx = rng.integers(0, len(_FEATURES), num_gdt)
+    datum_idx = rng.integers(0, len(DATUM_REFS), num_gdt)
+    tol_vals = np.round(rng.uniform(0.001, 0.250, num_gdt), 3)
+    gdt_fail = rng.random(num_gdt) >= _ROW_PASS_RATE
+    for k in range(num_gdt):
+        tol_type, symbol = GDT_TOLERANCE_TYPES[tol_idx[k]]
         gdt_data.append([
-            random.choice(features), tol_type, symbol,
-            random_tolerance(), random.choice(DATUM_REFS), status
+            _FEATURES[feat_idx[k]], tol_type, symbol,
+            f"±{tol_vals[k]} mm", DATUM_REFS[datum_idx[k]], "FAIL" if gdt_fail[k] else "PASS"
         ])
 
     gt = Table(gdt_data, colWidths=[1.5 * inch, 1.2 * inch, 0.6 * inch, 1.0 * inch, 0.8 * inch, 0.7 * inch])
-    gt.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a3a5c')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#cccccc')),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f5f7fa')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('ALIGN', (2, 0), (2, -1), 'CENTER'),
-        ('ALIGN', (5, 0), (5, -1), 'CENTER'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 6),
-        ('TOPPADDING', (0, 0), (-1, -1), 4),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-    ]))
+    gt.setStyle(_GDT_TABLE_STYLE)
+    fail_cmds = []
     for row_idx in range(1, len(gdt_data)):
         if gdt_data[row_idx][5] == "FAIL":
-            gt.setStyle(TableStyle([
-                ('TEXTCOLOR', (5, row_idx), (5, row_idx), colors.red),
-                ('FONTNAME', (5, row_idx), (5, row_idx), 'Helvetica-Bold'),
-            ]))
+            fail_cmds.append(('TEXTCOLOR', (5, row_idx), (5, row_idx), colors.red))
+            fail_cmds.append(('FONTNAME', (5, row_idx), (5, row_idx), 'Helvetica-Bold'))
+    if fail_cmds:
+        gt.setStyle(TableStyle(fail_cmds))
     story.append(gt)
     story.append(Spacer(1, 0.2 * inch))
 
     # Material Specifications
-    story.append(Paragraph("4. Material Specifications", heading_style))
-    num_mats = random.randint(3, 6)
-    mat_data = [["Component", "Material", "Grade/Spec", "Thickness (mm)", "Hardness"]]
-    components = [
-        "Enclosure Body", "Cover Plate", "Terminal Block", "Mounting Bracket",
-        "Heat Sink", "Bus Bar", "DIN Rail", "Gasket", "Cable Gland", "Internal Bracket"
-    ]
-    for _ in range(num_mats):
+    story.append(Paragraph("4. Material Specifications", _HEADING_STYLE))
+    num_mats = int(rng.integers(3, 7))
+    mat_data = [_MAT_HEADER]
+    comp_idx = rng.integers(0, len(_COMPONENTS), num_mats)
+    mat_idx = rng.integers(0, len(MATERIALS), num_mats)
+    astm_idx = rng.integers(0, len(_ASTM_GRADES), num_mats)
+    thickness = np.round(rng.uniform(0.5, 12.0, num_mats), 1)
+    hardness = rng.integers(40, 96, num_mats)
+    for k in range(num_mats):
         mat_data.append([
-            random.choice(components), random.choice(MATERIALS),
-            f"ASTM {random.choice(['A36', 'A572', 'B209', 'B152', 'D3935'])}",
-            f"{round(random.uniform(0.5, 12.0), 1)}",
-            f"{random.randint(40, 95)} HRB"
+            _COMPONENTS[comp_idx[k]], MATERIALS[mat_idx[k]],
+            _ASTM_GRADES[astm_idx[k]],
+            f"{thickness[k]}",
+            f"{hardness[k]} HRB"
         ])
     mt = Table(mat_data, colWidths=[1.4 * inch, 1.5 * inch, 1.2 * inch, 1.1 * inch, 0.8 * inch])
-    mt.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a3a5c')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#cccccc')),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f5f7fa')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 6),
-        ('TOPPADDING', (0, 0), (-1, -1), 4),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-    ]))
+    mt.setStyle(_MAT_TABLE_STYLE)
     story.append(mt)
-    story.append(PageBreak())
+    _draw_page(c, story)
+    story = []
 
     # Page 4: Test Results
-    story.append(Paragraph("5. Certification Test Results", heading_style))
+    story.append(Paragraph("5. Certification Test Results", _HEADING_STYLE))
     story.append(Paragraph(
         f"The following tests were conducted in accordance with {safety} and "
         f"applicable {standards} standards.",
-        body_style
+        _BODY_STYLE
     ))
 
-    num_tests = random.randint(7, 12)
-    test_data = [["Test Name", "Measured Value", "Threshold", "Result"]]
-    selected_tests = random.sample(TEST_NAMES, k=min(num_tests, len(TEST_NAMES)))
-    for test_name in selected_tests:
-        if "Dielectric" in test_name:
-            measured, threshold = f"{random.randint(1800, 2500)} VAC", "≥ 1500 VAC"
-        elif "Insulation" in test_name:
-            measured, threshold = f"{random.randint(80, 500)} MΩ", "≥ 50 MΩ"
-        elif "Ground" in test_name:
-            measured, threshold = f"{round(random.uniform(0.01, 0.15), 3)} Ω", "≤ 0.1 Ω"
-        elif "Temperature" in test_name:
-            measured = f"{random.randint(35, 75)}°C rise"
-            threshold = f"≤ {random.choice([65, 70, 75])}°C rise"
-        elif "Vibration" in test_name:
-            measured = f"{round(random.uniform(0.5, 5.0), 1)}g @ {random.randint(10, 500)} Hz"
-            threshold = f"≤ {round(random.uniform(3.0, 10.0), 1)}g"
-        elif "Salt" in test_name:
-            measured = f"{random.randint(200, 1000)} hours"
-            threshold = f"≥ {random.choice([200, 500, 720])} hours"
-        elif "Humidity" in test_name:
-            measured = f"{random.randint(85, 98)}% RH, {random.randint(24, 168)}h"
-            threshold = "95% RH, 48h min"
-        elif "Short-Circuit" in test_name:
-            measured = f"{random.randint(10, 100)} kA"
-            threshold = f"≥ {random.choice([10, 25, 50])} kA"
-        elif "Thermal Shock" in test_name:
-            measured = f"-{random.randint(20, 40)}°C to +{random.randint(60, 85)}°C"
-            threshold = f"-40°C to +{random.choice([70, 85])}°C"
-        else:
-            measured = f"{round(random.uniform(0.1, 100.0), 2)} units"
-            threshold = f"≤ {round(random.uniform(50, 200), 1)} units"
-        result = random.choices(["PASS", "FAIL"], weights=[9, 1])[0]
+    num_tests = int(rng.integers(7, 13))
+    test_data = [_TEST_HEADER]
+    test_idx = rng.choice(len(TEST_NAMES), size=min(num_tests, len(TEST_NAMES)), replace=False)
+    test_fail = rng.random(len(test_idx)) >= _ROW_PASS_RATE
+    # Each test kind needs at most three random numbers; draw them for every row in one call
+    test_u = rng.random((len(test_idx), 3))
+    for k, test_name in enumerate(TEST_NAMES[j] for j in test_idx):
+        measured, threshold = _TEST_MEASUREMENTS.get(test_name, _generic_measurement)(*test_u[k])
+        result = "FAIL" if test_fail[k] else "PASS"
         test_data.append([test_name, measured, threshold, result])
 
     tt = Table(test_data, colWidths=[2.2 * inch, 1.5 * inch, 1.5 * inch, 0.8 * inch])
-    tt.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a3a5c')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#cccccc')),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f5f7fa')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('ALIGN', (3, 0), (3, -1), 'CENTER'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 6),
-        ('TOPPADDING', (0, 0), (-1, -1), 4),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-    ]))
+    tt.setStyle(_TEST_TABLE_STYLE)
+    result_cmds = []
     for row_idx in range(1, len(test_data)):
         if test_data[row_idx][3] == "FAIL":
-            tt.setStyle(TableStyle([
-                ('TEXTCOLOR', (3, row_idx), (3, row_idx), colors.red),
-                ('FONTNAME', (3, row_idx), (3, row_idx), 'Helvetica-Bold'),
-            ]))
+            result_cmds.append(('TEXTCOLOR', (3, row_idx), (3, row_idx), colors.red))
+            result_cmds.append(('FONTNAME', (3, row_idx), (3, row_idx), 'Helvetica-Bold'))
         else:
-            tt.setStyle(TableStyle([
-                ('TEXTCOLOR', (3, row_idx), (3, row_idx), colors.HexColor('#228B22')),
-            ]))
+            result_cmds.append(('TEXTCOLOR', (3, row_idx), (3, row_idx), _COLOR_PASS_GREEN))
+    tt.setStyle(TableStyle(result_cmds))
     story.append(tt)
     story.append(Spacer(1, 0.3 * inch))
 
@@ -448,47 +583,56 @@ def generate_equipment_pdf(doc_index):
     passed = sum(1 for row in test_data[1:] if row[3] == "PASS")
     failed = total_tests - passed
 
-    story.append(Paragraph("6. Certification Summary", heading_style))
+    if cert_status == "PASS":
+        verdict = (
+            f"Based on the test results, the {eq_type_name} model {model} manufactured by "
+            f"{manufacturer} meets all requirements of {safety} and is hereby certified "
+            f"for use in industrial environments rated up to {ip}."
+        )
+    else:
+        verdict = (
+            f"The {eq_type_name} model {model} has received conditional certification pending "
+            f"resolution of {failed} failed test(s). The manufacturer must submit corrective "
+            f"action documentation within 90 days."
+        )
+
+    story.append(Paragraph("6. Certification Summary", _HEADING_STYLE))
+    # Counts and verdict share one Paragraph — a blank line instead of a Spacer saves a parse
     story.append(Paragraph(
         f"<b>Overall Status: {cert_status}</b><br/>"
         f"Total Tests Performed: {total_tests}<br/>"
         f"Tests Passed: {passed}<br/>"
         f"Tests Failed: {failed}<br/>"
-        f"Pass Rate: {round(passed / total_tests * 100, 1)}%",
-        body_style
+        f"Pass Rate: {round(passed / total_tests * 100, 1)}%<br/><br/>"
+        f"{verdict}",
+        _BODY_STYLE
     ))
-    story.append(Spacer(1, 0.15 * inch))
-
-    if cert_status == "PASS":
-        story.append(Paragraph(
-            f"Based on the test results, the {eq_type_name} model {model} manufactured by "
-            f"{manufacturer} meets all requirements of {safety} and is hereby certified "
-            f"for use in industrial environments rated up to {ip}.",
-            body_style
-        ))
-    elif cert_status == "CONDITIONAL":
-        story.append(Paragraph(
-            f"The {eq_type_name} model {model} has received conditional certification pending "
-            f"resolution of {failed} failed test(s). The manufacturer must submit corrective "
-            f"action documentation within 90 days.",
-            body_style
-        ))
 
     story.append(Spacer(1, 0.3 * inch))
-    story.append(HRFlowable(width="100%", thickness=1, color=colors.HexColor('#c41230')))
+    story.append(HRFlowable(width="100%", thickness=1, color=_COLOR_RED))
     story.append(Paragraph(
         "UL Solutions — Confidential Certification Document — Unauthorized reproduction prohibited",
-        small_style
+        _SMALL_STYLE
     ))
 
-    doc.build(story)
-    pdf_buffer.seek(0)
-    return {"filename": filename, "pdf_bytes": pdf_buffer.getvalue(),
+    _draw_page(c, story)
+    c.save()
+    # getbuffer() exposes the buffer's bytes without another full-size copy
+    return {"filename": filename, "pdf_bytes": pdf_buffer.getbuffer(),
             "equipment_name": eq_type_name, "model_number": model,
             "manufacturer": manufacturer, "certification_id": cert_id,
             "certification_status": cert_status}
 
 
+def _write_pdf(path, pdf_bytes):
+    """Write a finished PDF and return its size in bytes."""
+    # One write() of the full PDF, so the FUSE mount sees a single large write
+    # rather than 8 KiB buffer flushes
+    with open(path, "wb") as f:
+        f.write(pdf_bytes)
+    return len(pdf_bytes)
+
+
 # COMMAND ----------
 
 # MAGIC %md
@@ -499,22 +643,54 @@ def generate_equipment_pdf(doc_index):
 volume_dest = f"/Volumes/{catalog}/{schema}/{volume_name}/equipment_docs"
 print(f"Generating {NUM_DOCS} equipment certification PDFs directly to {volume_dest}/...")
 
-docs = []
-for i in range(NUM_DOCS):
-    meta = generate_equipment_pdf(i)
-    dest_path = f"{volume_dest}/{meta['filename']}"
-    with open(dest_path, "wb") as f:
-        f.write(meta["pdf_bytes"])
-    del meta["pdf_bytes"]
-    docs.append(meta)
+from pyspark.sql.types import StructType, StructField, StringType, LongType
+
+# Explicit schema so Spark never has to infer or parse types for the metadata rows
+DOCS_SCHEMA = StructType([
+    StructField("filename",             StringType(), False),
+    StructField("equipment_name",       StringType(), False),
+    StructField("model_number",         StringType(), False),
+    StructField("manufacturer",         StringType(), False),
+    StructField("certification_id",     StringType(), False),
+    StructField("certification_status", StringType(), False),
+    StructField("file_size_bytes",      LongType(),   False),
+])
+
+
+def _gen_partition(batches):
+    """mapInPandas worker: generate and write every document index in the partition."""
+    # Executors only receive the pickled functions, not this notebook's module-level setup
+    _warm_fonts()
+    # Generation holds the GIL but volume writes mostly wait on FUSE, so hand each
+    # finished PDF to a small I/O pool and start on the next document straight away
+    with ThreadPoolExecutor(max_workers=WRITE_THREADS) as io_pool:
+        for batch in batches:
+            pending = []
+            for i in batch["id"]:
+                meta = generate_equipment_pdf(int(i))
+                pdf_bytes = meta.pop("pdf_bytes")
+                pending.append((meta, io_pool.submit(_write_pdf, f"{volume_dest}/{meta['filename']}", pdf_bytes)))
+            for meta, write in pending:
+                meta["file_size_bytes"] = write.result()
+            yield pd.DataFrame([meta for meta, _ in pending])
+
+
+# Each PDF is independent and CPU-bound in reportlab, so spread generation across the
+# cluster's executors. The volume is FUSE-mounted on executors, so workers write directly.
+docs_df = (
+    spark.range(0, NUM_DOCS, 1, NUM_PARTITIONS)
+    .mapInPandas(_gen_partition, schema=DOCS_SCHEMA)
+)
+docs = [row.asDict() for row in docs_df.collect()]
+
+for i, meta in enumerate(docs):
     print(f"  [{i + 1}/{NUM_DOCS}] {meta['filename']} — {meta['equipment_name']} ({meta['manufacturer']})")
 
 print(f"\nWrote {NUM_DOCS} PDFs to {volume_dest}")
 
 # COMMAND ----------
 
-# Verify uploads
-files = dbutils.fs.ls(volume_dest)
-print(f"Files in volume ({len(files)}):")
-for f in files:
-    print(f"  {f.name} ({f.size:,} bytes)")
+# Verify uploads — sizes were recorded by the workers as each file was written
+print(f"Files in volume ({len(docs)}):")
+for meta in docs:
+    print(f"  {meta['filename']} ({meta['file_size_bytes']:,} bytes)")
@@ -11,20 +11,77 @@
 
 dbutils.widgets.text("catalog", "mfg_mc_se_sa", "Catalog")
 dbutils.widgets.text("schema", "ul_solutions", "Schema")
+dbutils.widgets.dropdown("include_exact_counts", "false", ["true", "false"], "Include exact distinct counts")
 
 catalog = dbutils.widgets.get("catalog")
 schema = dbutils.widgets.get("schema")
+include_exact_counts = dbutils.widgets.get("include_exact_counts") == "true"
 
 print(f"Catalog: {catalog}")
 print(f"Schema:  {schema}")
 
 # COMMAND ----------
 
+# MAGIC %md
+# MAGIC ## Collect Join Statistics
+# MAGIC
+# MAGIC Column statistics on the metric view's sources let the optimizer size each side of the
+# MAGIC `maintenance` join and broadcast the smaller one instead of shuffling both.
+
+# COMMAND ----------
+
+from pyspark.errors import AnalysisException
+
+STATS_COLUMNS = {
+    "gold_equipment_360": ["asset_id", "facility_id", "manufacturer", "equipment_type", "facility_name",
+                           "certification_status", "operational_status"],
+    "gold_maintenance_insights": ["asset_id", "manufacturer", "certification_status", "operational_status", "risk_category"],
+}
+
+for table, columns in STATS_COLUMNS.items():
+    try:
+        spark.sql(
+            f"ANALYZE TABLE {catalog}.{schema}.{table} "
+            f"COMPUTE STATISTICS FOR COLUMNS {', '.join(columns)}"
+        )
+        print(f"  Analyzed {table}: {', '.join(columns)}")
+    except AnalysisException as e:
+        print(f"  WARNING: could not analyze {table}: {e}")
+
+# COMMAND ----------
+
 # MAGIC %md
 # MAGIC ## Create the Metric View
 
 # COMMAND ----------
 
+# Distinct counts default to HyperLogLog sketches; exact COUNT(DISTINCT) variants
+# are only added when an audit needs them, since they force a distinct-key shuffle
+exact_count_measures = """\
+  - name: Distinct Facilities (Exact)
+    expr: COUNT(DISTINCT facility_name)
+    comment: "Exact number of facilities with equipment"
+  - name: Distinct Manufacturers (Exact)
+    expr: COUNT(DISTINCT manufacturer)
+    comment: "Exact number of unique equipment manufacturers"
+""" if include_exact_counts else ""
+
+# Display formats shared by the measures; rounding lives here rather than in ROUND() so
+# the stored aggregates stay exact and re-aggregatable
+usd_format = """\
+    format:
+      type: currency
+      currency_code: USD
+      decimal_places:
+        type: exact
+        places: 2"""
+number_format = """\
+    format:
+      type: number
+      decimal_places:
+        type: max
+        places: 1"""
+
 metric_view_sql = f"""
 CREATE OR REPLACE VIEW {catalog}.{schema}.equipment_certification_metrics
 WITH METRICS
@@ -103,19 +160,22 @@ dimensions:
     comment: "Computed risk flag (HIGH RISK, MEDIUM RISK, ELEVATED, NORMAL) based on certification status, open work orders, and inspection overdue"
 
 measures:
+  # Status counters compare the TINYINT *_status_code columns (see gold_equipment_360)
+  # rather than the status strings, which stay as the display dimensions
+
   # --- Asset counts ---
   - name: Total Assets
     expr: COUNT(*)
     comment: "Total equipment assets across all facilities"
   - name: Active Assets
-    expr: COUNT_IF(operational_status = 'Active')
-    comment: "Equipment currently in active operation"
+    expr: COUNT_IF(operational_status_code = 1)
+    comment: "Equipment currently in active operation (operational_status_code 1 = 'Active')"
   - name: Assets Under Maintenance
-    expr: COUNT_IF(operational_status = 'Under Maintenance')
-    comment: "Equipment currently under maintenance"
+    expr: COUNT_IF(operational_status_code = 2)
+    comment: "Equipment currently under maintenance (operational_status_code 2 = 'Under Maintenance')"
   - name: Decommissioned Assets
-    expr: COUNT_IF(operational_status = 'Decommissioned')
-    comment: "Equipment that has been decommissioned"
+    expr: COUNT_IF(operational_status_code = 4)
+    comment: "Equipment that has been decommissioned (operational_status_code 4 = 'Decommissioned')"
 
   # --- Certification ---
   - name: Certified Assets
@@ -125,56 +185,67 @@ measures:
     expr: COUNT_IF(has_certification = false)
     comment: "Assets without UL certification data"
   - name: Certification Pass Count
-    expr: COUNT_IF(certification_status = 'PASS')
-    comment: "Assets with passing certification"
+    expr: COUNT_IF(certification_status_code = 1)
+    comment: "Assets with passing certification (certification_status_code 1 = 'PASS')"
   - name: Conditional Certification Count
-    expr: COUNT_IF(certification_status = 'CONDITIONAL')
-    comment: "Assets with conditional certification"
+    expr: COUNT_IF(certification_status_code = 2)
+    comment: "Assets with conditional certification (certification_status_code 2 = 'CONDITIONAL')"
   - name: Certification Pass Rate
-    expr: ROUND(COUNT_IF(certification_status = 'PASS') * 100.0 / NULLIF(COUNT_IF(has_certification = true), 0), 1)
-    comment: "Percentage of certified equipment that passed"
+    # Single pass: uncertified rows map to NULL and drop out of the average, so this is
+    # PASS / certified without two separate conditional counts
+    expr: ROUND(AVG(CASE WHEN has_certification THEN CASE WHEN certification_status_code = 1 THEN 100.0 ELSE 0 END END), 1)
+    comment: "Percentage of certified equipment that passed (0-100; uncertified assets are excluded; certification_status_code 1 = 'PASS')"
 
   # --- Financial ---
   - name: Total Purchase Value (USD)
-    expr: ROUND(SUM(purchase_price_usd), 2)
+    expr: SUM(purchase_price_usd)
     comment: "Total purchase value of equipment"
+{usd_format}
   - name: Avg Purchase Price (USD)
-    expr: ROUND(AVG(purchase_price_usd), 2)
+    expr: AVG(purchase_price_usd)
     comment: "Average equipment purchase price"
+{usd_format}
   - name: Total Contract Value (USD)
-    expr: ROUND(SUM(DISTINCT contract_annual_value_usd), 2)
+    # Assets fan out contract rows; sum each contract once by id. Unlike SUM(DISTINCT value)
+    # this keeps contracts with equal values and avoids the distinct-aggregate rewrite.
+    expr: >-
+      aggregate(collect_set(named_struct('id', contract_id, 'value', contract_annual_value_usd)),
+      CAST(0 AS DOUBLE), (acc, c) -> acc + COALESCE(c.value, 0))
     comment: "Total annual manufacturer contract value"
+{usd_format}
 
   # --- Warranty & inspections ---
   - name: Expired Warranties
-    expr: COUNT_IF(warranty_status = 'Expired')
-    comment: "Equipment with expired warranties"
+    expr: COUNT_IF(warranty_status_code = 3)
+    comment: "Equipment with expired warranties (warranty_status_code 3 = 'Expired')"
   - name: Warranties Expiring Soon
-    expr: COUNT_IF(warranty_status = 'Expiring Soon')
-    comment: "Equipment with warranties expiring within 90 days"
+    expr: COUNT_IF(warranty_status_code = 2)
+    comment: "Equipment with warranties expiring within 90 days (warranty_status_code 2 = 'Expiring Soon')"
   - name: Overdue Inspections
-    expr: COUNT_IF(inspection_status = 'Overdue')
-    comment: "Equipment with overdue inspections"
+    expr: COUNT_IF(inspection_status_code = 3)
+    comment: "Equipment with overdue inspections (inspection_status_code 3 = 'Overdue')"
   - name: Inspections Due Soon
-    expr: COUNT_IF(inspection_status = 'Due Soon')
-    comment: "Equipment with inspections due within 30 days"
+    expr: COUNT_IF(inspection_status_code = 2)
+    comment: "Equipment with inspections due within 30 days (inspection_status_code 2 = 'Due Soon')"
 
   # --- Certification specs ---
   - name: Average Weight (kg)
-    expr: ROUND(AVG(weight_kg), 1)
+    expr: AVG(weight_kg)
     comment: "Average equipment weight in kilograms"
+{number_format}
   - name: Avg Operating Temp Range (C)
-    expr: ROUND(AVG(operating_temp_max_c - operating_temp_min_c), 1)
+    expr: AVG(operating_temp_range_c)
     comment: "Average operating temperature range"
+{number_format}
 
   # --- Cardinality ---
   - name: Distinct Facilities
-    expr: COUNT(DISTINCT facility_name)
-    comment: "Number of facilities with equipment"
+    expr: approx_count_distinct(facility_name)
+    comment: "Approximate number of facilities with equipment (HyperLogLog, <1% error)"
   - name: Distinct Manufacturers
-    expr: COUNT(DISTINCT manufacturer)
-    comment: "Number of unique equipment manufacturers"
-
+    expr: approx_count_distinct(manufacturer)
+    comment: "Approximate number of unique equipment manufacturers (HyperLogLog, <1% error)"
+{exact_count_measures}
   # --- Work order metrics (from gold_maintenance_insights) ---
   - name: Total Work Orders
     expr: SUM(maintenance.total_work_orders)
@@ -197,33 +268,39 @@ measures:
 
   # --- Maintenance cost & downtime ---
   - name: Total Maintenance Cost (USD)
-    expr: ROUND(SUM(maintenance.total_maintenance_cost_usd), 2)
+    expr: SUM(maintenance.total_maintenance_cost_usd)
     comment: "Total maintenance cost (labor at $85/hr + parts) across assets"
+{usd_format}
   - name: Avg Maintenance Cost Per Asset (USD)
-    expr: ROUND(AVG(maintenance.total_maintenance_cost_usd), 2)
+    expr: AVG(maintenance.total_maintenance_cost_usd)
     comment: "Average maintenance cost per asset"
+{usd_format}
   - name: Total Parts Cost (USD)
-    expr: ROUND(SUM(maintenance.total_parts_cost_usd), 2)
+    expr: SUM(maintenance.total_parts_cost_usd)
     comment: "Total parts cost across all work orders"
+{usd_format}
   - name: Total Labor Hours
-    expr: ROUND(SUM(maintenance.total_labor_hours), 1)
+    expr: SUM(maintenance.total_labor_hours)
     comment: "Total labor hours across all work orders"
+{number_format}
   - name: Avg Labor Hours Per Work Order
-    expr: ROUND(AVG(maintenance.avg_labor_hours_per_wo), 1)
+    expr: AVG(maintenance.avg_labor_hours_per_wo)
     comment: "Average labor hours per work order"
+{number_format}
   - name: Total Downtime Hours
-    expr: ROUND(SUM(maintenance.total_downtime_hours), 1)
+    expr: SUM(maintenance.total_downtime_hours)
     comment: "Total equipment downtime hours from maintenance"
+{number_format}
 
   # --- Risk & priority ---
   - name: High Risk Assets
-    expr: COUNT_IF(maintenance.risk_level LIKE 'HIGH RISK%')
+    expr: COUNT_IF(maintenance.risk_category = 'HIGH_RISK')
     comment: "Assets flagged as high risk (conditional cert + open work orders)"
   - name: Medium Risk Assets
-    expr: COUNT_IF(maintenance.risk_level LIKE 'MEDIUM RISK%')
+    expr: COUNT_IF(maintenance.risk_category = 'MEDIUM_RISK')
     comment: "Assets flagged as medium risk (conditional cert or overdue inspection)"
   - name: Elevated Risk Assets
-    expr: COUNT_IF(maintenance.risk_level LIKE 'ELEVATED%')
+    expr: COUNT_IF(maintenance.risk_category = 'ELEVATED')
     comment: "Assets with elevated risk (frequent emergency repairs)"
   - name: Critical Priority Work Orders
     expr: SUM(maintenance.critical_priority_count)
@@ -231,6 +308,66 @@ measures:
   - name: High Priority Work Orders
     expr: SUM(maintenance.high_priority_count)
     comment: "Work orders with high priority"
+
+# Precompute the joined rows on a schedule so Genie queries read a maintained
+# materialized view instead of re-running the source joins on every question.
+materialization:
+  schedule: every 1 hour
+  mode: relaxed
+  materialized_views:
+    - name: baseline
+      type: unaggregated
+    # One counter per status combination: "how many assets by status" questions become a
+    # lookup on this grouped aggregate instead of evaluating each COUNT_IF per asset row
+    - name: status_breakdown
+      type: aggregated
+      dimensions:
+        - Operational Status
+        - Certification Status
+        - Warranty Status
+        - Inspection Status
+      measures:
+        - Total Assets
+    # Status counts are plain row counts and therefore additive: stored per facility,
+    # they roll up to Region or the overall total without rescanning asset rows
+    - name: facility_status_counts
+      type: aggregated
+      dimensions:
+        - Region
+        - Facility Name
+      measures:
+        - Total Assets
+        - Active Assets
+        - Assets Under Maintenance
+        - Decommissioned Assets
+        - Certified Assets
+        - Uncertified Assets
+        - Certification Pass Count
+        - Conditional Certification Count
+        - Expired Warranties
+        - Warranties Expiring Soon
+        - Overdue Inspections
+        - Inspections Due Soon
+        - High Risk Assets
+        - Medium Risk Assets
+        - Elevated Risk Assets
+    # Certification rollup over the dimensions Genie groups by most often. Only additive
+    # measures are stored, so any coarser grouping (manufacturer alone, type x status, ...)
+    # is a re-sum of these rows; averages and distinct counts still read the baseline
+    - name: equipment_cert_rollups
+      type: aggregated
+      dimensions:
+        - Manufacturer
+        - Equipment Type
+        - Facility Name
+        - Certification Status
+      measures:
+        - Total Assets
+        - Certified Assets
+        - Uncertified Assets
+        - Certification Pass Count
+        - Conditional Certification Count
+        - Total Purchase Value (USD)
 $$
 """
 
@@ -245,3 +382,14 @@ print(f"Metric View created: {catalog}.{schema}.equipment_certification_metrics"
 # COMMAND ----------
 
 display(spark.sql(f"DESCRIBE EXTENDED {catalog}.{schema}.equipment_certification_metrics"))
+
+# COMMAND ----------
+
+# Data freshness — when each input to the metric view was last refreshed
+display(spark.sql(f"""
+SELECT table_name, table_type, last_altered
+FROM {catalog}.information_schema.tables
+WHERE table_schema = '{schema}'
+  AND table_name IN ('gold_equipment_360', 'gold_maintenance_insights', 'equipment_certification_metrics')
+ORDER BY table_name
+"""))
@@ -40,13 +40,12 @@ spark.sql(f"CREATE SCHEMA IF NOT EXISTS {catalog}.{schema}")
 
 # COMMAND ----------
 
-import random
-import hashlib
-from datetime import datetime, timedelta, date
-from pyspark.sql.types import *
-from pyspark.sql import functions as F
+from datetime import date
+from concurrent.futures import ThreadPoolExecutor
 
-random.seed(42)
+import numpy as np
+import pandas as pd
+from pyspark.sql.types import *
 
 MANUFACTURERS = [
     "Siemens Industrial Systems", "ABB Power Solutions", "Schneider Electric",
@@ -70,6 +69,54 @@ EQUIPMENT_TYPES = [
 VOLTAGES = ["120V AC", "240V AC", "480V AC", "24V DC", "48V DC", "600V AC"]
 IP_RATINGS = ["IP20", "IP44", "IP54", "IP55", "IP65", "IP66", "IP67"]
 
+# Reference "today" for inspection schedules and contract status
+AS_OF_DATE = np.datetime64("2026-02-17")
+
+# Each table draws from its own child of one root seed, so the tables stay reproducible
+# whatever order (or concurrency) they are generated and written in
+INVENTORY_SEED, WORK_ORDER_SEED, CONTRACT_SEED = np.random.SeedSequence(42).spawn(3)
+
+# Synthetic rows are generated in fixed-size blocks, each with its own seeded generator,
+# so output is reproducible no matter how Spark spreads the blocks across executors
+BLOCK_ROWS = 10_000
+
+
+def _block_rng(table_seed, block):
+    """Generator for one block: child `block` of the table's seed sequence."""
+    return np.random.default_rng(
+        np.random.SeedSequence(table_seed.entropy, spawn_key=table_seed.spawn_key + (block,))
+    )
+
+
+def _generate_blocks(num_rows, generate_block, schema):
+    """DataFrame of num_rows rows built by generate_block(block, first_row, n) on the executors."""
+    num_blocks = -(-num_rows // BLOCK_ROWS)
+
+    def _partition(batches):
+        for batch in batches:
+            for block in batch["id"]:
+                first = int(block) * BLOCK_ROWS
+                yield generate_block(int(block), first, min(BLOCK_ROWS, num_rows - first))
+
+    return spark.range(0, num_blocks, 1, num_blocks).mapInPandas(_partition, schema=schema)
+
+
+def _join_str(*parts):
+    """Element-wise concatenation of string/number arrays."""
+    out = np.asarray(parts[0]).astype(str)
+    for part in parts[1:]:
+        out = np.char.add(out, part if isinstance(part, str) else np.asarray(part).astype(str))
+    return out
+
+
+# IDs are the global row number (block * BLOCK_ROWS + offset), so every block knows its own
+# ID range without coordinating with the others, and other tables can reference any ID
+# directly — e.g. work orders draw asset IDs without reading the inventory
+def _format_ids(prefix, seq, width=6):
+    """Zero-padded IDs like AST-000042 for an array of 1-based sequence numbers."""
+    return _join_str(prefix, np.char.zfill(np.asarray(seq).astype(str), width))
+
+
 # COMMAND ----------
 
 # MAGIC %md
@@ -80,14 +127,14 @@ IP_RATINGS = ["IP20", "IP44", "IP54", "IP55", "IP65", "IP66", "IP67"]
 # COMMAND ----------
 
 facilities_data = [
-    ("FAC-001", "Chicago Manufacturing Complex",   "Chicago",        "IL", "United States", "North America", "Manufacturing Plant",  285000, 1420, "1998-03-15"),
-    ("FAC-002", "Houston Energy Center",           "Houston",        "TX", "United States", "North America", "Manufacturing Plant",  342000, 1850, "2002-07-22"),
-    ("FAC-003", "Detroit Automation Hub",           "Detroit",        "MI", "United States", "North America", "Manufacturing Plant",  198000, 980,  "2005-11-01"),
-    ("FAC-004", "Charlotte Distribution Center",   "Charlotte",      "NC", "United States", "North America", "Distribution Center",  156000, 420,  "2010-04-18"),
-    ("FAC-005", "San Jose R&D Laboratory",         "San Jose",       "CA", "United States", "North America", "R&D Laboratory",       78000,  310,  "2012-09-30"),
-    ("FAC-006", "Toronto Systems Integration",     "Toronto",        "ON", "Canada",        "North America", "Manufacturing Plant",  165000, 720,  "2008-01-10"),
-    ("FAC-007", "Monterrey Assembly Plant",        "Monterrey",      "NL", "Mexico",        "North America", "Manufacturing Plant",  210000, 1100, "2015-06-25"),
-    ("FAC-008", "Frankfurt European Operations",   "Frankfurt",      "HE", "Germany",       "EMEA",          "Manufacturing Plant",  230000, 1280, "2001-08-14"),
+    ("FAC-001", "Chicago Manufacturing Complex",   "Chicago",        "IL", "United States", "North America", "Manufacturing Plant",  285000, 1420, date(1998, 3, 15)),
+    ("FAC-002", "Houston Energy Center",           "Houston",        "TX", "United States", "North America", "Manufacturing Plant",  342000, 1850, date(2002, 7, 22)),
+    ("FAC-003", "Detroit Automation Hub",           "Detroit",        "MI", "United States", "North America", "Manufacturing Plant",  198000, 980,  date(2005, 11, 1)),
+    ("FAC-004", "Charlotte Distribution Center",   "Charlotte",      "NC", "United States", "North America", "Distribution Center",  156000, 420,  date(2010, 4, 18)),
+    ("FAC-005", "San Jose R&D Laboratory",         "San Jose",       "CA", "United States", "North America", "R&D Laboratory",       78000,  310,  date(2012, 9, 30)),
+    ("FAC-006", "Toronto Systems Integration",     "Toronto",        "ON", "Canada",        "North America", "Manufacturing Plant",  165000, 720,  date(2008, 1, 10)),
+    ("FAC-007", "Monterrey Assembly Plant",        "Monterrey",      "NL", "Mexico",        "North America", "Manufacturing Plant",  210000, 1100, date(2015, 6, 25)),
+    ("FAC-008", "Frankfurt European Operations",   "Frankfurt",      "HE", "Germany",       "EMEA",          "Manufacturing Plant",  230000, 1280, date(2001, 8, 14)),
 ]
 
 facilities_schema = StructType([
@@ -100,15 +147,11 @@ facilities_schema = StructType([
     StructField("facility_type",   StringType(), False),
     StructField("square_footage",  IntegerType(), False),
     StructField("employee_count",  IntegerType(), False),
-    StructField("opened_date",     StringType(), False),
+    StructField("opened_date",     DateType(), False),
 ])
 
-df_facilities = spark.createDataFrame(facilities_data, schema=facilities_schema) \
-    .withColumn("opened_date", F.to_date("opened_date"))
+df_facilities = spark.createDataFrame(facilities_data, schema=facilities_schema)
 
-facilities_path = f"{volume_base}/facilities"
-df_facilities.write.mode("overwrite").parquet(facilities_path)
-print(f"Wrote {df_facilities.count()} rows to {facilities_path}/")
 df_facilities.display()
 
 # COMMAND ----------
@@ -121,14 +164,15 @@ df_facilities.display()
 
 # COMMAND ----------
 
-def generate_model_number(prefix):
-    return f"{prefix}-{random.randint(1000, 9999)}-{random.choice('ABCDEFGH')}{random.randint(1, 9)}"
+NUM_ASSETS = 120
+
+EQ_TYPE_NAMES = np.array([t[0] for t in EQUIPMENT_TYPES])
+EQ_PREFIXES = np.array([t[1] for t in EQUIPMENT_TYPES])
 
-def generate_serial(manufacturer, idx):
-    mfr_code = "".join(w[0] for w in manufacturer.split()[:2]).upper()
-    return f"{mfr_code}-{random.randint(2020, 2026)}-{idx:06d}"
+# Serial numbers start with the initials of the manufacturer's first two words
+MFR_CODES = np.array(["".join(w[0] for w in m.split()[:2]).upper() for m in MANUFACTURERS])
 
-facility_ids = [f[0] for f in facilities_data]
+facility_ids = np.array([f[0] for f in facilities_data])
 
 # Weight by facility size — larger plants have more equipment
 facility_weights = {
@@ -144,54 +188,68 @@ INSTALL_LOCATIONS = [
     "Maintenance Shop", "Boiler Room", "Compressor Room"
 ]
 
+# Normalized once so every block can make a single weighted draw
+_fac_weights = np.array([facility_weights[f] for f in facility_ids], dtype=np.float64)
+FACILITY_P = _fac_weights / _fac_weights.sum()
+
 OPERATIONAL_STATUSES = ["Active", "Active", "Active", "Active", "Active",
                          "Under Maintenance", "Standby", "Decommissioned"]
 
-inventory_rows = []
-for i in range(120):
-    eq_type_name, eq_prefix = random.choice(EQUIPMENT_TYPES)
-    manufacturer = random.choice(MANUFACTURERS)
-    model = generate_model_number(eq_prefix)
-    fac_id = random.choices(facility_ids, weights=[facility_weights[f] for f in facility_ids])[0]
-
-    purchase_date = date(2018, 1, 1) + timedelta(days=random.randint(0, 2800))
-    warranty_years = random.choice([1, 2, 3, 5])
-    warranty_exp = purchase_date + timedelta(days=warranty_years * 365)
-    last_inspection = purchase_date + timedelta(days=random.randint(30, min(2800, (date(2026, 2, 17) - purchase_date).days)))
-    next_inspection = last_inspection + timedelta(days=random.choice([90, 180, 365]))
-
-    # Price varies by equipment type — transformers and switchgear are expensive
-    base_prices = {
-        "TRU": (18000, 85000), "SGA": (25000, 120000), "PDU": (8000, 35000),
-        "VFD": (3000, 22000),  "PLC": (2000, 15000),   "UPS": (5000, 40000),
-        "CBA": (1500, 12000),  "IMC": (2500, 18000),   "MSP": (4000, 25000),
-        "IRM": (800, 6000),
-    }
-    price_range = base_prices.get(eq_prefix, (2000, 20000))
-    purchase_price = round(random.uniform(*price_range), 2)
-
-    voltage = random.choice(VOLTAGES)
-    ip_rating = random.choice(IP_RATINGS)
-    op_status = random.choice(OPERATIONAL_STATUSES)
-
-    inventory_rows.append((
-        f"AST-{i+1:06d}",
-        model,
-        eq_type_name,
-        eq_prefix,
-        manufacturer,
-        fac_id,
-        generate_serial(manufacturer, i+1),
-        str(purchase_date),
-        purchase_price,
-        str(warranty_exp),
-        op_status,
-        voltage,
-        ip_rating,
-        str(last_inspection),
-        str(next_inspection),
-        random.choice(INSTALL_LOCATIONS),
-    ))
+# Price varies by equipment type — transformers and switchgear are expensive
+BASE_PRICES = {
+    "TRU": (18000, 85000), "SGA": (25000, 120000), "PDU": (8000, 35000),
+    "VFD": (3000, 22000),  "PLC": (2000, 15000),   "UPS": (5000, 40000),
+    "CBA": (1500, 12000),  "IMC": (2500, 18000),   "MSP": (4000, 25000),
+    "IRM": (800, 6000),
+}
+PRICE_LO, PRICE_HI = np.array([BASE_PRICES.get(p, (2000, 20000)) for p in EQ_PREFIXES], dtype=np.float64).T
+
+
+def _to_dates(d):
+    """datetime.date objects for a datetime64 array, ready for a DateType column."""
+    return d.astype("datetime64[D]").astype(object)
+
+
+def generate_model_numbers(prefixes, rng):
+    n = len(prefixes)
+    return _join_str(prefixes, "-", rng.integers(1000, 10000, n), "-",
+                     rng.choice(list("ABCDEFGH"), n), rng.integers(1, 10, n))
+
+
+def generate_inventory_block(block, first, n):
+    # One vectorized draw per column instead of a Python loop over rows
+    rng = _block_rng(INVENTORY_SEED, block)
+    eq_idx = rng.integers(0, len(EQUIPMENT_TYPES), n)
+    mfr_idx = rng.integers(0, len(MANUFACTURERS), n)
+    fac_draws = rng.choice(facility_ids, n, p=FACILITY_P)
+
+    purchase_date = np.datetime64("2018-01-01") + rng.integers(0, 2801, n)
+    warranty_exp = purchase_date + rng.choice([1, 2, 3, 5], n) * 365
+    days_to_cutoff = (AS_OF_DATE - purchase_date).astype(np.int64)
+    last_inspection = purchase_date + rng.integers(30, np.minimum(2800, days_to_cutoff) + 1)
+    next_inspection = last_inspection + rng.choice([90, 180, 365], n)
+
+    asset_seq = np.arange(first + 1, first + n + 1)
+
+    return pd.DataFrame({
+        "asset_id":             _format_ids("AST-", asset_seq),
+        "model_number":         generate_model_numbers(EQ_PREFIXES[eq_idx], rng),
+        "equipment_type":       EQ_TYPE_NAMES[eq_idx],
+        "equipment_type_code":  EQ_PREFIXES[eq_idx],
+        "manufacturer":         np.array(MANUFACTURERS)[mfr_idx],
+        "facility_id":          fac_draws,
+        "serial_number":        _join_str(MFR_CODES[mfr_idx], "-", rng.integers(2020, 2027, n), "-",
+                                          np.char.zfill(asset_seq.astype(str), 6)),
+        "purchase_date":        _to_dates(purchase_date),
+        "purchase_price_usd":   np.round(rng.uniform(PRICE_LO[eq_idx], PRICE_HI[eq_idx]), 2),
+        "warranty_expiration":  _to_dates(warranty_exp),
+        "operational_status":   rng.choice(OPERATIONAL_STATUSES, n),
+        "voltage_rating":       rng.choice(VOLTAGES, n),
+        "ip_rating":            rng.choice(IP_RATINGS, n),
+        "last_inspection_date": _to_dates(last_inspection),
+        "next_inspection_due":  _to_dates(next_inspection),
+        "install_location":     rng.choice(INSTALL_LOCATIONS, n),
+    })
 
 inventory_schema = StructType([
     StructField("asset_id",              StringType(), False),
@@ -201,26 +259,19 @@ inventory_schema = StructType([
     StructField("manufacturer",          StringType(), False),
     StructField("facility_id",           StringType(), False),
     StructField("serial_number",         StringType(), False),
-    StructField("purchase_date",         StringType(), False),
+    StructField("purchase_date",         DateType(), False),
     StructField("purchase_price_usd",    DoubleType(), False),
-    StructField("warranty_expiration",   StringType(), False),
+    StructField("warranty_expiration",   DateType(), False),
     StructField("operational_status",    StringType(), False),
     StructField("voltage_rating",        StringType(), False),
     StructField("ip_rating",             StringType(), False),
-    StructField("last_inspection_date",  StringType(), False),
-    StructField("next_inspection_due",   StringType(), False),
+    StructField("last_inspection_date",  DateType(), False),
+    StructField("next_inspection_due",   DateType(), False),
     StructField("install_location",      StringType(), False),
 ])
 
-df_inventory = spark.createDataFrame(inventory_rows, schema=inventory_schema) \
-    .withColumn("purchase_date",        F.to_date("purchase_date")) \
-    .withColumn("warranty_expiration",  F.to_date("warranty_expiration")) \
-    .withColumn("last_inspection_date", F.to_date("last_inspection_date")) \
-    .withColumn("next_inspection_due",  F.to_date("next_inspection_due"))
+df_inventory = _generate_blocks(NUM_ASSETS, generate_inventory_block, inventory_schema)
 
-inventory_path = f"{volume_base}/equipment_inventory"
-df_inventory.write.mode("overwrite").parquet(inventory_path)
-print(f"Wrote {df_inventory.count()} rows to {inventory_path}/")
 df_inventory.display()
 
 # COMMAND ----------
@@ -284,59 +335,61 @@ WORK_DESCRIPTIONS = {
         "Emergency response — smoke detected from enclosure, isolated and inspected",
     ],
 }
-
-asset_ids = [row[0] for row in inventory_rows]
-
-work_order_rows = []
-for i in range(500):
-    asset_id = random.choice(asset_ids)
-    wo_type = random.choice(WORK_ORDER_TYPES)
-    priority = random.choice(PRIORITIES)
-    if wo_type == "Emergency Repair":
-        priority = random.choice(["Critical", "Critical", "High"])
-
-    status = random.choice(WO_STATUSES)
-
-    created = datetime(2024, 1, 1) + timedelta(
-        days=random.randint(0, 775),
-        hours=random.randint(6, 18),
-        minutes=random.randint(0, 59),
+DESCRIPTION_ARRAYS = {t: np.array(d) for t, d in WORK_DESCRIPTIONS.items()}
+
+NUM_WORK_ORDERS = 500
+
+
+def generate_work_order_block(block, first, n):
+    rng = _block_rng(WORK_ORDER_SEED, block)
+    wo_type = rng.choice(WORK_ORDER_TYPES, n)
+    emergency = wo_type == "Emergency Repair"
+    priority = rng.choice(PRIORITIES, n)
+    priority[emergency] = rng.choice(["Critical", "Critical", "High"], emergency.sum())
+    status = rng.choice(WO_STATUSES, n)
+
+    # One draw per work-order type rather than a dict lookup + choice per row
+    description = np.full(n, "General maintenance activity", dtype=object)
+    for t, descs in DESCRIPTION_ARRAYS.items():
+        mask = wo_type == t
+        description[mask] = rng.choice(descs, mask.sum())
+
+    created = (
+        np.datetime64("2024-01-01T00:00")
+        + rng.integers(0, 776, n).astype("timedelta64[D]")
+        + rng.integers(6, 19, n).astype("timedelta64[h]")
+        + rng.integers(0, 60, n).astype("timedelta64[m]")
     )
-
-    scheduled = (created + timedelta(days=random.randint(0, 14))).date()
-    if wo_type == "Emergency Repair":
-        scheduled = created.date()
-
-    completed_date = None
-    labor_hours = None
-    parts_cost = None
-    downtime_hours = None
-
-    if status == "Completed":
-        completed_date = str(scheduled + timedelta(days=random.randint(0, 3)))
-        labor_hours = round(random.uniform(0.5, 16.0), 1)
-        parts_cost = round(random.uniform(0, 4500), 2) if wo_type in ("Corrective Repair", "Emergency Repair", "Preventive Maintenance") else 0.0
-        downtime_hours = round(random.uniform(0, 8.0), 1) if wo_type in ("Corrective Repair", "Emergency Repair") else 0.0
-    elif status == "In Progress":
-        labor_hours = round(random.uniform(0.5, 4.0), 1)
-
-    description = random.choice(WORK_DESCRIPTIONS.get(wo_type, ["General maintenance activity"]))
-
-    work_order_rows.append((
-        f"WO-{i+1:06d}",
-        asset_id,
-        wo_type,
-        priority,
-        status,
-        str(created),
-        str(scheduled),
-        completed_date,
-        random.choice(TECHNICIANS),
-        description,
-        labor_hours,
-        parts_cost,
-        downtime_hours,
-    ))
+    # Emergency repairs are scheduled the day they're raised
+    scheduled = created.astype("datetime64[D]") + np.where(emergency, 0, rng.integers(0, 15, n))
+
+    completed = status == "Completed"
+    in_progress = status == "In Progress"
+    has_parts = np.isin(wo_type, ["Corrective Repair", "Emergency Repair", "Preventive Maintenance"])
+    is_repair = np.isin(wo_type, ["Corrective Repair", "Emergency Repair"])
+
+    completed_date = scheduled + rng.integers(0, 4, n)
+    labor_hours = np.where(completed, rng.uniform(0.5, 16.0, n), rng.uniform(0.5, 4.0, n)).round(1)
+    parts_cost = np.where(has_parts, rng.uniform(0, 4500, n).round(2), 0.0)
+    downtime_hours = np.where(is_repair, rng.uniform(0, 8.0, n).round(1), 0.0)
+
+    return pd.DataFrame({
+        "work_order_id":   _format_ids("WO-", np.arange(first + 1, first + n + 1)),
+        # Asset IDs are sequential, so any asset can be referenced without reading the inventory
+        "asset_id":        _format_ids("AST-", rng.integers(1, NUM_ASSETS + 1, n)),
+        "work_order_type": wo_type,
+        "priority":        priority,
+        "status":          status,
+        "created_at":      created,
+        "scheduled_date":  _to_dates(scheduled),
+        # Only completed orders have a completion date, costs and downtime; open ones have no labor yet
+        "completed_date":  np.where(completed, _to_dates(completed_date), None),
+        "technician_name": rng.choice(TECHNICIANS, n),
+        "description":     description,
+        "labor_hours":     np.where(completed | in_progress, labor_hours, None),
+        "parts_cost_usd":  np.where(completed, parts_cost, None),
+        "downtime_hours":  np.where(completed, downtime_hours, None),
+    })
 
 wo_schema = StructType([
     StructField("work_order_id",    StringType(), False),
@@ -344,9 +397,9 @@ wo_schema = StructType([
     StructField("work_order_type",  StringType(), False),
     StructField("priority",         StringType(), False),
     StructField("status",           StringType(), False),
-    StructField("created_at",       StringType(), False),
-    StructField("scheduled_date",   StringType(), False),
-    StructField("completed_date",   StringType(), True),
+    StructField("created_at",       TimestampType(), False),
+    StructField("scheduled_date",   DateType(), False),
+    StructField("completed_date",   DateType(), True),
     StructField("technician_name",  StringType(), False),
     StructField("description",      StringType(), False),
     StructField("labor_hours",      DoubleType(), True),
@@ -354,14 +407,8 @@ wo_schema = StructType([
     StructField("downtime_hours",   DoubleType(), True),
 ])
 
-df_work_orders = spark.createDataFrame(work_order_rows, schema=wo_schema) \
-    .withColumn("created_at",     F.to_timestamp("created_at")) \
-    .withColumn("scheduled_date", F.to_date("scheduled_date")) \
-    .withColumn("completed_date", F.to_date("completed_date"))
+df_work_orders = _generate_blocks(NUM_WORK_ORDERS, generate_work_order_block, wo_schema)
 
-work_orders_path = f"{volume_base}/work_orders"
-df_work_orders.write.mode("overwrite").parquet(work_orders_path)
-print(f"Wrote {df_work_orders.count()} rows to {work_orders_path}/")
 df_work_orders.display()
 
 # COMMAND ----------
@@ -376,49 +423,38 @@ df_work_orders.display()
 
 CONTRACT_TYPES = ["Service Agreement", "Parts Supply", "Extended Warranty"]
 
-contracts_data = []
-for i, manufacturer in enumerate(MANUFACTURERS):
-    contract_type = random.choice(CONTRACT_TYPES)
-    start = date(2023, 1, 1) + timedelta(days=random.randint(0, 365))
-    duration_years = random.choice([1, 2, 3, 5])
-    end = start + timedelta(days=duration_years * 365)
-
-    today = date(2026, 2, 17)
-    if end < today:
-        status = "Expired"
-    elif (end - today).days < 90:
-        status = "Expiring Soon"
-    else:
-        status = "Active"
-
-    annual_value = round(random.uniform(25000, 350000), 2)
-    sla_hours = random.choice([2, 4, 4, 8, 8, 24])
-
-    first_names = ["John", "Maria", "David", "Sarah", "Kenji", "Hans", "Priya", "Wei", "Carlos", "Anna"]
-    last_names = ["Mueller", "Santos", "Park", "Williams", "Tanaka", "Fischer", "Sharma", "Chang", "Rodriguez", "Johansson"]
-    contact_name = f"{first_names[i]} {last_names[i]}"
-    domain = manufacturer.lower().replace(" ", "").replace(".", "")[:12]
-    contact_email = f"{contact_name.lower().replace(' ', '.')}@{domain}.com"
-
-    contracts_data.append((
-        f"CTR-{i+1:04d}",
-        manufacturer,
-        contract_type,
-        str(start),
-        str(end),
-        annual_value,
-        sla_hours,
-        status,
-        contact_name,
-        contact_email,
-    ))
+CONTACT_FIRST_NAMES = ["John", "Maria", "David", "Sarah", "Kenji", "Hans", "Priya", "Wei", "Carlos", "Anna"]
+CONTACT_LAST_NAMES = ["Mueller", "Santos", "Park", "Williams", "Tanaka", "Fischer", "Sharma", "Chang", "Rodriguez", "Johansson"]
+
+num_contracts = len(MANUFACTURERS)
+contracts_rng = _block_rng(CONTRACT_SEED, 0)
+
+start = np.datetime64("2023-01-01") + contracts_rng.integers(0, 366, num_contracts)
+end = start + contracts_rng.choice([1, 2, 3, 5], num_contracts) * 365
+days_left = (end - AS_OF_DATE).astype(np.int64)
+
+contact_names = [f"{first} {last}" for first, last in zip(CONTACT_FIRST_NAMES, CONTACT_LAST_NAMES)]
+contact_domains = [m.lower().replace(" ", "").replace(".", "")[:12] for m in MANUFACTURERS]
+
+pdf_contracts = pd.DataFrame({
+    "contract_id":        _format_ids("CTR-", np.arange(1, num_contracts + 1), width=4),
+    "manufacturer":       MANUFACTURERS,
+    "contract_type":      contracts_rng.choice(CONTRACT_TYPES, num_contracts),
+    "start_date":         _to_dates(start),
+    "end_date":           _to_dates(end),
+    "annual_value_usd":   np.round(contracts_rng.uniform(25000, 350000, num_contracts), 2),
+    "sla_response_hours": contracts_rng.choice([2, 4, 4, 8, 8, 24], num_contracts).astype(np.int32),
+    "contract_status":    np.select([days_left < 0, days_left < 90], ["Expired", "Expiring Soon"], "Active"),
+    "primary_contact":    contact_names,
+    "contact_email":      [f"{c.lower().replace(' ', '.')}@{d}.com" for c, d in zip(contact_names, contact_domains)],
+})
 
 contracts_schema = StructType([
     StructField("contract_id",       StringType(), False),
     StructField("manufacturer",      StringType(), False),
     StructField("contract_type",     StringType(), False),
-    StructField("start_date",        StringType(), False),
-    StructField("end_date",          StringType(), False),
+    StructField("start_date",        DateType(), False),
+    StructField("end_date",          DateType(), False),
     StructField("annual_value_usd",  DoubleType(), False),
     StructField("sla_response_hours", IntegerType(), False),
     StructField("contract_status",   StringType(), False),
@@ -426,17 +462,41 @@ contracts_schema = StructType([
     StructField("contact_email",     StringType(), False),
 ])
 
-df_contracts = spark.createDataFrame(contracts_data, schema=contracts_schema) \
-    .withColumn("start_date", F.to_date("start_date")) \
-    .withColumn("end_date",   F.to_date("end_date"))
+df_contracts = spark.createDataFrame(pdf_contracts, schema=contracts_schema)
 
-contracts_path = f"{volume_base}/manufacturer_contracts"
-df_contracts.write.mode("overwrite").parquet(contracts_path)
-print(f"Wrote {df_contracts.count()} rows to {contracts_path}/")
 df_contracts.display()
 
 # COMMAND ----------
 
+# MAGIC %md
+# MAGIC ## Write Tables to the Volume
+# MAGIC
+# MAGIC The four tables are independent, so their parquet writes are submitted together.
+
+# COMMAND ----------
+
+# Row counts are fixed by the generators, so they're known without a count job
+tables = {
+    "facilities":             (df_facilities,  len(facilities_data)),
+    "equipment_inventory":    (df_inventory,   NUM_ASSETS),
+    "work_orders":            (df_work_orders, NUM_WORK_ORDERS),
+    "manufacturer_contracts": (df_contracts,   num_contracts),
+}
+
+
+def _write_table(name):
+    df, _ = tables[name]
+    df.write.mode("overwrite").parquet(f"{volume_base}/{name}")
+    return name
+
+
+# Each write blocks its thread while Spark does the work, so the threads overlap the jobs
+with ThreadPoolExecutor(max_workers=len(tables)) as pool:
+    for name in pool.map(_write_table, tables):
+        print(f"Wrote {tables[name][1]} rows to {volume_base}/{name}/")
+
+# COMMAND ----------
+
 # MAGIC %md
 # MAGIC ## Summary
 # MAGIC
@@ -444,11 +504,10 @@ df_contracts.display()
 
 # COMMAND ----------
 
-tables = ["facilities", "equipment_inventory", "work_orders", "manufacturer_contracts"]
-for t in tables:
-    path = f"{volume_base}/{t}"
-    count = spark.read.parquet(path).count()
-    print(f"  {path}: {count:,} rows")
+# Every table's size is fixed by the generator, so report the known counts instead of
+# launching a count job per table (or re-reading what was just written)
+for t, (_, count) in tables.items():
+    print(f"  {volume_base}/{t}: {count:,} rows")
 
 print(f"\nParquet files written to {volume_base}/")
 print("The SDP pipeline will ingest these via read_files() into streaming tables,")
@@ -12,12 +12,19 @@
 dbutils.widgets.text("catalog", "mfg_mc_se_sa", "Catalog")
 dbutils.widgets.text("schema", "ul_solutions", "Schema")
 dbutils.widgets.text("volume_name", "raw_data", "Volume Name")
+dbutils.widgets.dropdown("contextualize_docs", "true", ["true", "false"], "Contextualize KA Chunks")
+dbutils.widgets.dropdown("wait_for_ready", "false", ["true", "false"], "Wait for KA before MAS")
+dbutils.widgets.dropdown("batch_mas_examples", "false", ["true", "false"], "Batch MAS Examples")
 
 catalog = dbutils.widgets.get("catalog")
 schema = dbutils.widgets.get("schema")
 volume_name = dbutils.widgets.get("volume_name")
+contextualize_docs = dbutils.widgets.get("contextualize_docs") == "true"
+wait_for_ready = dbutils.widgets.get("wait_for_ready") == "true"
+batch_mas_examples = dbutils.widgets.get("batch_mas_examples") == "true"
 
 VOLUME_PATH = f"/Volumes/{catalog}/{schema}/{volume_name}/equipment_docs"
+CONTEXTUALIZED_PATH = f"/Volumes/{catalog}/{schema}/{volume_name}/equipment_docs_contextualized"
 KA_NAME = "UL_Solutions_Equipment_Docs"
 MAS_NAME = "UL_Solutions_Equipment_Intelligence"
 GENIE_SPACE_NAME = "UL Solutions Equipment Catalog"
@@ -37,12 +44,97 @@ print(f"Genie Space: {GENIE_SPACE_NAME}")
 # COMMAND ----------
 
 import json
+import os
+import random
+import re
+import shutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 from databricks.sdk import WorkspaceClient
+from pyspark.errors import AnalysisException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 w = WorkspaceClient()
 
+HOST = w.config.host
+TILES_URL = f"{HOST}/api/2.0/tiles"
+KA_URL = f"{HOST}/api/2.0/knowledge-assistants"
+DATA_ROOMS_URL = f"{HOST}/api/2.0/data-rooms"
+MAS_URL = f"{HOST}/api/2.0/multi-agent-supervisors"
+
+AUTH_TTL_SECONDS = 300
+
+
+class AuthSession(requests.Session):
+    """Session that attaches cached workspace auth headers and re-authenticates once on a 401."""
+
+    def __init__(self, w, ttl=AUTH_TTL_SECONDS):
+        super().__init__()
+        self._w = w
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._auth_headers = None
+        self._auth_expiry = 0.0
+
+    def auth_headers(self, refresh=False):
+        with self._lock:
+            if refresh or self._auth_headers is None or time.monotonic() > self._auth_expiry - 30:
+                self._auth_headers = self._w.config.authenticate()
+                self._auth_expiry = time.monotonic() + self._ttl
+            return self._auth_headers
+
+    def request(self, method, url, headers=None, **kwargs):
+        resp = super().request(method, url, headers={**self.auth_headers(), **(headers or {})}, **kwargs)
+        if resp.status_code == 401:
+            resp = super().request(
+                method, url, headers={**self.auth_headers(refresh=True), **(headers or {})}, **kwargs
+            )
+        return resp
+
+
+# One pooled session for every REST call below, so the notebook pays for a
+# single TLS handshake. Only the idempotent GET lookups are retried on
+# throttling/5xx responses; the create and example POSTs are sent once, since
+# retrying a create that the server already applied would duplicate it.
+SESSION = AuthSession(w)
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+        ),
+    ),
+)
+
+# Request bodies are encoded once up front and sent as bytes, so the
+# adapter retries and the 401 re-auth resend them without re-serializing.
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+READY_STATUSES = {"ONLINE"}
+
+
+def wait_until_ready(get_fn, tile_id, key, initial=2.0, max_delay=30.0, timeout=600):
+    """Poll a tile's endpoint status with jittered exponential backoff until it is ready."""
+    deadline = time.monotonic() + timeout
+    delay = initial
+    while True:
+        status = get_fn(tile_id).get(key, {}).get("status", {}).get("endpoint_status")
+        if status in READY_STATUSES:
+            return status
+        if time.monotonic() + delay > deadline:
+            raise TimeoutError(f"{tile_id} not ready after {timeout}s (last status: {status})")
+        time.sleep(delay + random.uniform(0, delay * 0.1))
+        delay = min(delay * 1.7, max_delay)
+
 # COMMAND ----------
 
 # MAGIC %md
@@ -58,12 +150,10 @@ w = WorkspaceClient()
 
 # COMMAND ----------
 
-def find_ka_by_name(w, name):
-    """Find a Knowledge Assistant by exact name using the tiles API."""
-    headers = w.config.authenticate()
-    url = f"{w.config.host}/api/2.0/tiles"
-    params = {"filter": f"name_contains={name}&&tile_type=KA"}
-    resp = requests.get(url, headers=headers, params=params, timeout=30)
+def find_tile_by_name(name, tile_type):
+    """Find a tile of the given type by exact name using the tiles API."""
+    params = {"filter": f"name_contains={name}&&tile_type={tile_type}"}
+    resp = SESSION.get(TILES_URL, params=params, timeout=30)
     resp.raise_for_status()
     for tile in resp.json().get("tiles", []):
         if tile.get("name") == name:
@@ -71,12 +161,13 @@ def find_ka_by_name(w, name):
     return None
 
 
-def create_knowledge_assistant(w, name, volume_path, description, instructions):
-    """Create a Knowledge Assistant with a UC Volume knowledge source."""
-    headers = w.config.authenticate()
-    headers["Content-Type"] = "application/json"
-    url = f"{w.config.host}/api/2.0/knowledge-assistants"
+def find_ka_by_name(name):
+    """Find a Knowledge Assistant by exact name using the tiles API."""
+    return find_tile_by_name(name, "KA")
+
 
+def create_knowledge_assistant(name, volume_path, description, instructions):
+    """Create a Knowledge Assistant with a UC Volume knowledge source."""
     source_name = volume_path.rstrip("/").split("/")[-1]
     payload = {
         "name": name,
@@ -92,42 +183,126 @@ def create_knowledge_assistant(w, name, volume_path, description, instructions):
             }
         ],
     }
-    resp = requests.post(url, headers=headers, json=payload, timeout=300)
+    resp = SESSION.post(KA_URL, data=json.dumps(payload).encode(), headers=JSON_HEADERS, timeout=300)
     resp.raise_for_status()
     return resp.json()
 
 
-def get_ka(w, tile_id):
+def get_ka(tile_id):
     """Get Knowledge Assistant details by tile ID."""
-    headers = w.config.authenticate()
-    url = f"{w.config.host}/api/2.0/knowledge-assistants/{tile_id}"
-    resp = requests.get(url, headers=headers, timeout=30)
+    resp = SESSION.get(f"{KA_URL}/{tile_id}", timeout=30)
     resp.raise_for_status()
     return resp.json()
 
 # COMMAND ----------
 
-existing_ka = find_ka_by_name(w, KA_NAME)
+# MAGIC %md
+# MAGIC ### Contextualize Document Chunks
+# MAGIC
+# MAGIC A chunk like "Measured: 0.048 mm — PASS" is ambiguous on its own. When a new KA
+# MAGIC is created, each parsed certification is rewritten as element-aligned blocks
+# MAGIC prefixed with the report it came from (certification ID, manufacturer, model,
+# MAGIC equipment type). The blocks don't line up with the KA's own chunk boundaries, so
+# MAGIC this raises the share of chunks that carry their report context rather than
+# MAGIC guaranteeing it for every chunk. Falls back to the raw PDFs if the pipeline has
+# MAGIC not produced `gold_equipment_catalog` yet. An existing KA keeps its source.
 
-if existing_ka:
-    ka_tile_id = existing_ka["tile_id"]
-    ka_details = get_ka(w, ka_tile_id)
-    ka_status = ka_details.get("knowledge_assistant", {}).get("status", {}).get("endpoint_status", "UNKNOWN")
-    print(f"Knowledge Assistant already exists:")
-    print(f"  Tile ID: {ka_tile_id}")
-    print(f"  Name:    {KA_NAME}")
-    print(f"  Status:  {ka_status}")
-else:
-    print(f"Creating Knowledge Assistant '{KA_NAME}'...")
+# COMMAND ----------
+
+CONTEXT_BLOCK_CHARS = 2000
+
+
+def context_prefix(row):
+    """Describe the report a chunk came from, using only the extracted fields that are present."""
+    subject = " ".join(v for v in (row.manufacturer, row.model_number) if v)
+    if row.equipment_type:
+        subject = f"{subject} ({row.equipment_type})" if subject else row.equipment_type
+    if not (row.certification_id or subject):
+        return ""
+    report = f"certification report {row.certification_id}" if row.certification_id else "a certification report"
+    return f"This chunk is from {report}" + (f" for the {subject}." if subject else ".")
+
+
+def contextualize_document(row):
+    """Split parsed document text into ~2 KB element-aligned blocks, each prefixed with its report context."""
+    prefix = context_prefix(row)
+    blocks, current = [], ""
+    for element in row.document_text.split("\n\n"):
+        if current and len(current) + len(element) > CONTEXT_BLOCK_CHARS:
+            blocks.append(current)
+            current = ""
+        current = f"{current}\n\n{element}" if current else element
+    if current:
+        blocks.append(current)
+    if prefix:
+        blocks = [f"{prefix}\n\n{block}" for block in blocks]
+    return "\n\n---\n\n".join(blocks)
+
+
+def prepare_ka_source():
+    """Write contextualized Markdown for every parsed certification and return the KA source path."""
+    if not contextualize_docs:
+        return VOLUME_PATH
+    try:
+        parsed_docs = (
+            spark.table(f"{catalog}.{schema}.gold_equipment_catalog")
+            .where("trim(document_text) <> ''")
+            .select("file_name", "document_text", "certification_id",
+                    "manufacturer", "model_number", "equipment_type")
+            .collect()
+        )
+    except AnalysisException as e:
+        print(f"Could not read gold_equipment_catalog ({e}); using raw PDFs")
+        return VOLUME_PATH
+    if not parsed_docs:
+        return VOLUME_PATH
+
+    # Start from an empty directory so documents deleted or renamed upstream are not indexed
+    shutil.rmtree(CONTEXTUALIZED_PATH, ignore_errors=True)
+    os.makedirs(CONTEXTUALIZED_PATH, exist_ok=True)
+    written = set()
+    for row in parsed_docs:
+        # file_name can be NULL when the parser found no metadata; the certification ID is the next best key
+        stem = os.path.splitext(row.file_name)[0] if row.file_name else row.certification_id
+        if not stem:
+            continue
+        out_name, n = f"{stem}.md", 1
+        while out_name in written:
+            n += 1
+            out_name = f"{stem}_{n}.md"
+        written.add(out_name)
+        with open(os.path.join(CONTEXTUALIZED_PATH, out_name), "w") as f:
+            f.write(contextualize_document(row))
+    print(f"Wrote {len(written)} contextualized documents to {CONTEXTUALIZED_PATH}")
+    return CONTEXTUALIZED_PATH
+
+# COMMAND ----------
+
+def ensure_knowledge_assistant():
+    """Return (tile_id, status, source_path) for the KA, creating it if it does not exist.
+
+    source_path is None for an existing KA, whose knowledge source is left as is.
+    """
+    existing_ka = find_ka_by_name(KA_NAME)
+
+    if existing_ka:
+        ka_tile_id = existing_ka["tile_id"]
+        # The tiles listing usually carries the endpoint status already.
+        ka_status = existing_ka.get("status", {}).get("endpoint_status")
+        if ka_status is None:
+            ka_details = get_ka(ka_tile_id)
+            ka_status = ka_details.get("knowledge_assistant", {}).get("status", {}).get("endpoint_status", "UNKNOWN")
+        return ka_tile_id, ka_status, None
+
+    ka_source_path = prepare_ka_source()
     ka_result = create_knowledge_assistant(
-        w,
         name=KA_NAME,
-        volume_path=VOLUME_PATH,
+        volume_path=ka_source_path,
         description=(
             "Answers questions about UL Solutions industrial equipment certification "
             "reports. Retrieves specific test results, GD&T tolerances, compliance "
             "standards, material specifications, and certification details directly "
-            "from source PDF documents stored in Unity Catalog Volumes."
+            "from the certification report documents stored in Unity Catalog Volumes."
         ),
         instructions=(
             "You are a technical assistant for UL Solutions equipment certification "
@@ -154,10 +329,8 @@ else:
         .get("status", {})
         .get("endpoint_status", "PROVISIONING")
     )
-    print(f"Knowledge Assistant created:")
-    print(f"  Tile ID: {ka_tile_id}")
-    print(f"  Name:    {KA_NAME}")
-    print(f"  Status:  {ka_status}")
+    return ka_tile_id, ka_status, ka_source_path
+
 
 # COMMAND ----------
 
@@ -174,11 +347,9 @@ else:
 
 # COMMAND ----------
 
-def find_genie_space_by_name(w, display_name):
+def find_genie_space_by_name(display_name):
     """Find a Genie Space by display name."""
-    headers = w.config.authenticate()
-    url = f"{w.config.host}/api/2.0/data-rooms"
-    resp = requests.get(url, headers=headers, timeout=30)
+    resp = SESSION.get(DATA_ROOMS_URL, timeout=30)
     resp.raise_for_status()
     for space in resp.json().get("spaces", []):
         if space.get("display_name") == display_name:
@@ -187,19 +358,44 @@ def find_genie_space_by_name(w, display_name):
 
 # COMMAND ----------
 
-genie_space = find_genie_space_by_name(w, GENIE_SPACE_NAME)
+# Step 1 (KA lookup/create) has no dependency on the Genie Space, so it runs in
+# the background while the space is looked up here. If the lookup fails, a KA call
+# that has not started is cancelled; one already in flight is joined on exiting
+# the with-block, so nothing keeps running after this cell fails.
+with ThreadPoolExecutor(max_workers=1) as lookup_pool:
+    print(f"Looking up or creating Knowledge Assistant '{KA_NAME}'...")
+    ka_future = lookup_pool.submit(ensure_knowledge_assistant)
+    try:
+        genie_space = find_genie_space_by_name(GENIE_SPACE_NAME)
+        if not genie_space:
+            raise ValueError(
+                f"Genie Space '{GENIE_SPACE_NAME}' not found. "
+                "Create it in the Databricks UI first with the "
+                "equipment_certification_metrics metric view."
+            )
+    except BaseException:
+        ka_future.cancel()
+        raise
+    ka_tile_id, ka_status, ka_source_path = ka_future.result()
+
+genie_space_id = genie_space["space_id"]
+print(f"Found Genie Space:")
+print(f"  Space ID: {genie_space_id}")
+print(f"  Name:     {genie_space['display_name']}")
 
-if genie_space:
-    genie_space_id = genie_space["space_id"]
-    print(f"Found Genie Space:")
-    print(f"  Space ID: {genie_space_id}")
-    print(f"  Name:     {genie_space['display_name']}")
-else:
-    raise ValueError(
-        f"Genie Space '{GENIE_SPACE_NAME}' not found. "
-        "Create it in the Databricks UI first with the "
-        "equipment_certification_metrics metric view."
-    )
+# COMMAND ----------
+
+print(f"Knowledge Assistant {'created' if ka_source_path else 'already exists'}:")
+print(f"  Tile ID: {ka_tile_id}")
+print(f"  Name:    {KA_NAME}")
+print(f"  Status:  {ka_status}")
+if ka_source_path:
+    print(f"  Source:  {ka_source_path}")
+
+if wait_for_ready and ka_status not in READY_STATUSES:
+    print("Waiting for the Knowledge Assistant endpoint to come online...")
+    ka_status = wait_until_ready(get_ka, ka_tile_id, "knowledge_assistant")
+    print(f"  Status:  {ka_status}")
 
 # COMMAND ----------
 
@@ -215,67 +411,147 @@ else:
 
 # COMMAND ----------
 
-def find_mas_by_name(w, name):
+def find_mas_by_name(name):
     """Find a Multi-Agent Supervisor by exact name using the tiles API."""
-    headers = w.config.authenticate()
-    url = f"{w.config.host}/api/2.0/tiles"
-    params = {"filter": f"name_contains={name}&&tile_type=MAS"}
-    resp = requests.get(url, headers=headers, params=params, timeout=30)
-    resp.raise_for_status()
-    for tile in resp.json().get("tiles", []):
-        if tile.get("name") == name:
-            return tile
-    return None
+    return find_tile_by_name(name, "MAS")
 
 
-def create_multi_agent_supervisor(w, name, agents, description, instructions):
+def create_multi_agent_supervisor(name, agents, description, instructions):
     """Create a Multi-Agent Supervisor."""
-    headers = w.config.authenticate()
-    headers["Content-Type"] = "application/json"
-    url = f"{w.config.host}/api/2.0/multi-agent-supervisors"
-
     payload = {
         "name": name,
         "agents": agents,
         "description": description,
         "instructions": instructions,
     }
-    resp = requests.post(url, headers=headers, json=payload, timeout=300)
+    resp = SESSION.post(MAS_URL, data=json.dumps(payload).encode(), headers=JSON_HEADERS, timeout=300)
     resp.raise_for_status()
     return resp.json()
 
 
-def get_mas(w, tile_id):
+def get_mas(tile_id):
     """Get Multi-Agent Supervisor details by tile ID."""
-    headers = w.config.authenticate()
-    url = f"{w.config.host}/api/2.0/multi-agent-supervisors/{tile_id}"
-    resp = requests.get(url, headers=headers, timeout=30)
+    resp = SESSION.get(f"{MAS_URL}/{tile_id}", timeout=30)
     resp.raise_for_status()
     return resp.json()
 
 
-def add_mas_examples(w, tile_id, examples):
-    """Add example questions to a Multi-Agent Supervisor."""
-    headers = w.config.authenticate()
-    headers["Content-Type"] = "application/json"
-    created = []
-    for ex in examples:
-        url = f"{w.config.host}/api/2.0/multi-agent-supervisors/{tile_id}/examples"
+def add_mas_examples(tile_id, examples):
+    """Add example questions to a Multi-Agent Supervisor, posting them concurrently.
+
+    With batch_mas_examples set, one call to the experimental examples:batch endpoint is
+    tried first, falling back to the per-example posts if the endpoint does not exist.
+    """
+    url = f"{MAS_URL}/{tile_id}/examples"
+
+    def _example_payload(ex):
         payload = {"tile_id": tile_id, "question": ex["question"]}
         if ex.get("guideline"):
             payload["guidelines"] = [ex["guideline"]]
+        return payload
+
+    def _post_example(ex):
+        resp = SESSION.post(url, data=json.dumps(_example_payload(ex)).encode(), headers=JSON_HEADERS, timeout=30)
+        resp.raise_for_status()
+        return resp.json()
+
+    if not examples:
+        return []
+
+    if batch_mas_examples:
+        # Only a 404/405 proves the batch was never applied, so any other failure is
+        # reported rather than re-posted one by one, which could duplicate examples
+        batch_body = json.dumps({"examples": [_example_payload(ex) for ex in examples]}).encode()
         try:
-            resp = requests.post(url, headers=headers, json=payload, timeout=30)
-            resp.raise_for_status()
-            created.append(resp.json())
-            print(f"  Added example: {ex['question'][:60]}...")
-        except Exception as e:
-            print(f"  Failed to add example: {e}")
+            resp = SESSION.post(f"{url}:batch", data=batch_body, headers=JSON_HEADERS, timeout=60)
+        except requests.RequestException as e:
+            print(f"  Failed to add examples in batch: {e}")
+            return []
+        if resp.ok:
+            for ex in examples:
+                print(f"  Added example: {ex['question'][:60]}...")
+            try:
+                return resp.json().get("examples", [])
+            except ValueError:
+                return []
+        if resp.status_code not in (404, 405):
+            print(f"  Failed to add examples in batch: HTTP {resp.status_code} {resp.text[:200]}")
+            return []
+
+    created = []
+    with ThreadPoolExecutor(max_workers=min(16, len(examples))) as pool:
+        futures = [(ex, pool.submit(_post_example, ex)) for ex in examples]
+        for ex, future in futures:
+            error = future.exception()
+            if error is None:
+                created.append(future.result())
+                print(f"  Added example: {ex['question'][:60]}...")
+            else:
+                print(f"  Failed to add example: {error}")
     return created
 
 # COMMAND ----------
 
+# MAGIC %md
+# MAGIC ### Deterministic Query Router
+# MAGIC
+# MAGIC Most questions name their domain outright ("pass rate", "inventory", "GD&T",
+# MAGIC "tolerances"). `route_equipment_query` classifies those with keyword matches
+# MAGIC so the supervisor can delegate without reasoning over the full routing
+# MAGIC instructions; it returns `both` or `NULL` when the LLM should decide.
+
+# COMMAND ----------
+
+ROUTER_FUNCTION = f"{catalog}.{schema}.route_equipment_query"
+
+DOCS_ROUTING_TERMS = [
+    "gd&t", "tolerance", "test result", "measurement", "threshold", "conditional",
+    "failed", "failure", "corrective action", "material spec", "specification",
+    "compliance standard", "model number", "certification report", "datum",
+]
+CATALOG_ROUTING_TERMS = [
+    "pass rate", "how many", "count", "average", "inventory", "facility",
+    "facilities", "plant", "maintenance", "work order", "contract", "warranty",
+    "manufacturers", "compare", "comparison", "trend", "by equipment type",
+]
+
+
+def routing_pattern(terms):
+    """Whole-word RLIKE pattern matching any term (optionally plural), as a SQL string literal body."""
+    regex = r"\b(?:" + "|".join(re.escape(t) for t in terms) + r")s?\b"
+    # Spark SQL string literals treat backslash and single quote as escapes
+    return regex.replace("\\", "\\\\").replace("'", "\\'")
+
+
+docs_pattern = routing_pattern(DOCS_ROUTING_TERMS)
+catalog_pattern = routing_pattern(CATALOG_ROUTING_TERMS)
+
+spark.sql(f"""
+CREATE OR REPLACE FUNCTION {ROUTER_FUNCTION}(q STRING)
+RETURNS STRING
+COMMENT 'Keyword router for UL Solutions equipment questions: docs, catalog, both, or NULL when unclear'
+RETURN CASE
+  WHEN lower(q) RLIKE '{docs_pattern}' AND lower(q) RLIKE '{catalog_pattern}' THEN 'both'
+  WHEN lower(q) RLIKE '{docs_pattern}' THEN 'docs'
+  WHEN lower(q) RLIKE '{catalog_pattern}' THEN 'catalog'
+END
+""")
+print(f"Registered routing function {ROUTER_FUNCTION}")
+
+# COMMAND ----------
+
 MAS_AGENTS = [
+    {
+        "name": "query_router",
+        "description": (
+            "Deterministic keyword router. Call it first with the user's question; "
+            "it returns 'docs', 'catalog', 'both', or NULL"
+        ),
+        "agent_type": "unity_catalog_function",
+        "unity_catalog_function": {
+            "uc_path": {"catalog": catalog, "schema": schema, "name": "route_equipment_query"},
+        },
+    },
     {
         "name": "equipment_docs_agent",
         "description": (
@@ -300,6 +576,9 @@ MAS_AGENTS = [
 
 MAS_INSTRUCTIONS = (
     "You are a supervisor agent for UL Solutions equipment intelligence. "
+    "First call query_router with the user's question. If it returns 'docs', route to "
+    "equipment_docs_agent; if it returns 'catalog', route to equipment_catalog_agent. "
+    "Only when it returns 'both' or NULL, decide using the rules below.\n\n"
     "Route questions as follows:\n\n"
     "1. Route to the equipment_docs_agent (Knowledge Assistant) when the user asks about:\n"
     "   - Specific certification report details (test results, measurements, thresholds)\n"
@@ -349,16 +628,18 @@ MAS_EXAMPLES = [
 
 # COMMAND ----------
 
-existing_mas = find_mas_by_name(w, MAS_NAME)
+existing_mas = find_mas_by_name(MAS_NAME)
 
 if existing_mas:
     mas_tile_id = existing_mas["tile_id"]
-    mas_details = get_mas(w, mas_tile_id)
-    mas_status = (
-        mas_details.get("multi_agent_supervisor", {})
-        .get("status", {})
-        .get("endpoint_status", "UNKNOWN")
-    )
+    mas_status = existing_mas.get("status", {}).get("endpoint_status")
+    if mas_status is None:
+        mas_details = get_mas(mas_tile_id)
+        mas_status = (
+            mas_details.get("multi_agent_supervisor", {})
+            .get("status", {})
+            .get("endpoint_status", "UNKNOWN")
+        )
     print(f"Multi-Agent Supervisor already exists:")
     print(f"  Tile ID: {mas_tile_id}")
     print(f"  Name:    {MAS_NAME}")
@@ -366,7 +647,6 @@ if existing_mas:
 else:
     print(f"Creating Multi-Agent Supervisor '{MAS_NAME}'...")
     mas_result = create_multi_agent_supervisor(
-        w,
         name=MAS_NAME,
         agents=MAS_AGENTS,
         description=MAS_DESCRIPTION,
@@ -389,7 +669,7 @@ else:
     print(f"  Status:  {mas_status}")
 
     print(f"\nAdding {len(MAS_EXAMPLES)} routing examples...")
-    add_mas_examples(w, mas_tile_id, MAS_EXAMPLES)
+    add_mas_examples(mas_tile_id, MAS_EXAMPLES)
 
 # COMMAND ----------
 
@@ -404,8 +684,8 @@ print("=" * 60)
 print()
 print(f"Knowledge Assistant: {KA_NAME}")
 print(f"  Tile ID:     {ka_tile_id}")
-print(f"  Volume Path: {VOLUME_PATH}")
-print(f"  Purpose:     RAG over certification PDFs")
+print(f"  Volume Path: {ka_source_path or 'unchanged (existing Knowledge Assistant)'}")
+print(f"  Purpose:     RAG over certification reports")
 print()
 print(f"Genie Space: {GENIE_SPACE_NAME}")
 print(f"  Space ID:  {genie_space_id}")
@@ -413,7 +693,8 @@ print(f"  Purpose:   Natural language SQL over metric views")
 print()
 print(f"Multi-Agent Supervisor: {MAS_NAME}")
 print(f"  Tile ID:  {mas_tile_id}")
-print(f"  Agents:   equipment_docs_agent (KA), equipment_catalog_agent (Genie)")
+print(f"  Agents:   equipment_docs_agent (KA), equipment_catalog_agent (Genie), query_router (UC function)")
+print(f"  Router:   {ROUTER_FUNCTION}")
 print(f"  Purpose:  Intelligent routing between document Q&A and data analytics")
 print()
 print("Provisioning typically takes 2-5 minutes. Check status in the")
@@ -4,6 +4,8 @@
 -- ============================================================================
 
 CREATE OR REFRESH STREAMING TABLE bronze_equipment_inventory
+-- Clustered on the gold-layer join keys so asset_id / facility_id lookups skip unrelated files
+CLUSTER BY (asset_id, facility_id)
 AS
 SELECT
   *,
@@ -4,6 +4,8 @@
 -- ============================================================================
 
 CREATE OR REFRESH STREAMING TABLE bronze_work_orders
+-- Clustered on the gold-layer join keys so asset_id lookups skip unrelated files
+CLUSTER BY (asset_id)
 AS
 SELECT
   *,
@@ -12,6 +12,7 @@
 -- ============================================================================
 
 CREATE OR REFRESH MATERIALIZED VIEW gold_equipment_360
+CLUSTER BY (manufacturer, equipment_type, facility_name, certification_status)
 AS
 SELECT
   -- Inventory identifiers
@@ -65,6 +66,7 @@ SELECT
   gc.weight_kg,
   gc.operating_temp_min_c,
   gc.operating_temp_max_c,
+  gc.operating_temp_max_c - gc.operating_temp_min_c AS operating_temp_range_c,
   gc.compliance_standards,
   gc.model_number           AS certified_model_number,
   gc.file_name              AS certification_document,
@@ -75,6 +77,19 @@ SELECT
     ELSE false
   END AS has_certification,
 
+  -- TINYINT status codes for the metric view's COUNT_IF measures: each code is the
+  -- 1-based position of the status string in its label list (0 = unlisted value),
+  -- derived from the string column above (warranty/inspection via lateral column
+  -- alias) so the two cannot drift apart
+  CAST(array_position(array('Active', 'Under Maintenance', 'Standby', 'Decommissioned'),
+                      ei.operational_status) AS TINYINT) AS operational_status_code,
+  CAST(array_position(array('Active', 'Expiring Soon', 'Expired'),
+                      warranty_status) AS TINYINT)    AS warranty_status_code,
+  CAST(array_position(array('Current', 'Due Soon', 'Overdue'),
+                      inspection_status) AS TINYINT)  AS inspection_status_code,
+  CAST(array_position(array('PASS', 'CONDITIONAL'),
+                      gc.certification_status) AS TINYINT) AS certification_status_code,
+
   -- Contract data
   mc.contract_id,
   mc.contract_type,
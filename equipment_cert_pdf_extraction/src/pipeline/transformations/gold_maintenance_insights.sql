@@ -94,6 +94,10 @@ SELECT
     ELSE 'NORMAL'
   END AS risk_level,
 
+  -- Bare risk bucket for equality filters and counts: the label before the dash
+  -- ('HIGH RISK — ...' -> 'HIGH_RISK'), so the branches above stay the only definition
+  replace(split_part(risk_level, ' — ', 1), ' ', '_') AS risk_category,
+
   -- Inspection context
   ei.last_inspection_date,
   ei.next_inspection_due,
@@ -67,19 +67,22 @@ dimensions:
     comment: "Manufacturer contract state (Active, Expiring Soon, Expired)"
 
 measures:
+  # Status counters compare the TINYINT *_status_code columns (see gold_equipment_360)
+  # rather than the status strings, which stay as the display dimensions
+
   # --- Inventory measures ---
   - name: Total Assets
     expr: COUNT(*)
     comment: "Total equipment assets across all facilities"
   - name: Active Assets
-    expr: COUNT_IF(operational_status = 'Active')
-    comment: "Equipment currently in active operation"
+    expr: COUNT_IF(operational_status_code = 1)
+    comment: "Equipment currently in active operation (operational_status_code 1 = 'Active')"
   - name: Assets Under Maintenance
-    expr: COUNT_IF(operational_status = 'Under Maintenance')
-    comment: "Equipment currently under maintenance"
+    expr: COUNT_IF(operational_status_code = 2)
+    comment: "Equipment currently under maintenance (operational_status_code 2 = 'Under Maintenance')"
   - name: Decommissioned Assets
-    expr: COUNT_IF(operational_status = 'Decommissioned')
-    comment: "Equipment that has been decommissioned"
+    expr: COUNT_IF(operational_status_code = 4)
+    comment: "Equipment that has been decommissioned (operational_status_code 4 = 'Decommissioned')"
 
   # --- Certification measures ---
   - name: Certified Assets
@@ -89,53 +92,144 @@ measures:
     expr: COUNT_IF(has_certification = false)
     comment: "Assets without UL certification data"
   - name: Certification Pass Count
-    expr: COUNT_IF(certification_status = 'PASS')
-    comment: "Assets with passing certification"
+    expr: COUNT_IF(certification_status_code = 1)
+    comment: "Assets with passing certification (certification_status_code 1 = 'PASS')"
   - name: Conditional Certification Count
-    expr: COUNT_IF(certification_status = 'CONDITIONAL')
-    comment: "Assets with conditional certification"
+    expr: COUNT_IF(certification_status_code = 2)
+    comment: "Assets with conditional certification (certification_status_code 2 = 'CONDITIONAL')"
   - name: Certification Pass Rate
-    expr: ROUND(COUNT_IF(certification_status = 'PASS') * 100.0 / NULLIF(COUNT_IF(has_certification = true), 0), 1)
-    comment: "Percentage of certified equipment that passed"
+    # Single pass: uncertified rows map to NULL and drop out of the average, so this is
+    # PASS / certified without two separate conditional counts
+    expr: ROUND(AVG(CASE WHEN has_certification THEN CASE WHEN certification_status_code = 1 THEN 100.0 ELSE 0 END END), 1)
+    comment: "Percentage of certified equipment that passed (0-100; uncertified assets are excluded; certification_status_code 1 = 'PASS')"
 
   # --- Financial measures ---
   - name: Total Purchase Value (USD)
-    expr: ROUND(SUM(purchase_price_usd), 2)
+    expr: SUM(purchase_price_usd)
     comment: "Total purchase value of equipment"
+    format:
+      type: currency
+      currency_code: USD
+      decimal_places:
+        type: exact
+        places: 2
   - name: Avg Purchase Price (USD)
-    expr: ROUND(AVG(purchase_price_usd), 2)
+    expr: AVG(purchase_price_usd)
     comment: "Average equipment purchase price"
+    format:
+      type: currency
+      currency_code: USD
+      decimal_places:
+        type: exact
+        places: 2
   - name: Total Contract Value (USD)
-    expr: ROUND(SUM(DISTINCT contract_annual_value_usd), 2)
+    # Assets fan out contract rows; sum each contract once by id. Unlike SUM(DISTINCT value)
+    # this keeps contracts with equal values and avoids the distinct-aggregate rewrite.
+    expr: >-
+      aggregate(collect_set(named_struct('id', contract_id, 'value', contract_annual_value_usd)),
+      CAST(0 AS DOUBLE), (acc, c) -> acc + COALESCE(c.value, 0))
     comment: "Total annual manufacturer contract value"
+    format:
+      type: currency
+      currency_code: USD
+      decimal_places:
+        type: exact
+        places: 2
 
   # --- Warranty & inspection measures ---
   - name: Expired Warranties
-    expr: COUNT_IF(warranty_status = 'Expired')
-    comment: "Equipment with expired warranties"
+    expr: COUNT_IF(warranty_status_code = 3)
+    comment: "Equipment with expired warranties (warranty_status_code 3 = 'Expired')"
   - name: Warranties Expiring Soon
-    expr: COUNT_IF(warranty_status = 'Expiring Soon')
-    comment: "Equipment with warranties expiring within 90 days"
+    expr: COUNT_IF(warranty_status_code = 2)
+    comment: "Equipment with warranties expiring within 90 days (warranty_status_code 2 = 'Expiring Soon')"
   - name: Overdue Inspections
-    expr: COUNT_IF(inspection_status = 'Overdue')
-    comment: "Equipment with overdue inspections"
+    expr: COUNT_IF(inspection_status_code = 3)
+    comment: "Equipment with overdue inspections (inspection_status_code 3 = 'Overdue')"
   - name: Inspections Due Soon
-    expr: COUNT_IF(inspection_status = 'Due Soon')
-    comment: "Equipment with inspections due within 30 days"
+    expr: COUNT_IF(inspection_status_code = 2)
+    comment: "Equipment with inspections due within 30 days (inspection_status_code 2 = 'Due Soon')"
 
   # --- Physical measures (from certification) ---
   - name: Average Weight (kg)
-    expr: ROUND(AVG(weight_kg), 1)
+    expr: AVG(weight_kg)
     comment: "Average equipment weight in kilograms"
+    format:
+      type: number
+      decimal_places:
+        type: max
+        places: 1
   - name: Avg Operating Temp Range (C)
-    expr: ROUND(AVG(operating_temp_max_c - operating_temp_min_c), 1)
+    expr: AVG(operating_temp_range_c)
     comment: "Average operating temperature range"
+    format:
+      type: number
+      decimal_places:
+        type: max
+        places: 1
 
   # --- Facility measures ---
   - name: Distinct Facilities
-    expr: COUNT(DISTINCT facility_name)
-    comment: "Number of facilities with equipment"
+    expr: approx_count_distinct(facility_name)
+    comment: "Approximate number of facilities with equipment (HyperLogLog, <1% error)"
   - name: Distinct Manufacturers
-    expr: COUNT(DISTINCT manufacturer)
-    comment: "Number of unique equipment manufacturers"
+    expr: approx_count_distinct(manufacturer)
+    comment: "Approximate number of unique equipment manufacturers (HyperLogLog, <1% error)"
+
+# Precompute the joined rows on a schedule so Genie queries read a maintained
+# materialized view instead of re-running the source joins on every question.
+materialization:
+  schedule: every 1 hour
+  mode: relaxed
+  materialized_views:
+    - name: baseline
+      type: unaggregated
+    # One counter per status combination: "how many assets by status" questions become a
+    # lookup on this grouped aggregate instead of evaluating each COUNT_IF per asset row
+    - name: status_breakdown
+      type: aggregated
+      dimensions:
+        - Operational Status
+        - Certification Status
+        - Warranty Status
+        - Inspection Status
+      measures:
+        - Total Assets
+    # Status counts are plain row counts and therefore additive: stored per facility,
+    # they roll up to Region or the overall total without rescanning asset rows
+    - name: facility_status_counts
+      type: aggregated
+      dimensions:
+        - Region
+        - Facility Name
+      measures:
+        - Total Assets
+        - Active Assets
+        - Assets Under Maintenance
+        - Decommissioned Assets
+        - Certified Assets
+        - Uncertified Assets
+        - Certification Pass Count
+        - Conditional Certification Count
+        - Expired Warranties
+        - Warranties Expiring Soon
+        - Overdue Inspections
+        - Inspections Due Soon
+    # Certification rollup over the dimensions Genie groups by most often. Only additive
+    # measures are stored, so any coarser grouping (manufacturer alone, type x status, ...)
+    # is a re-sum of these rows; averages and distinct counts still read the baseline
+    - name: equipment_cert_rollups
+      type: aggregated
+      dimensions:
+        - Manufacturer
+        - Equipment Type
+        - Facility Name
+        - Certification Status
+      measures:
+        - Total Assets
+        - Certified Assets
+        - Uncertified Assets
+        - Certification Pass Count
+        - Conditional Certification Count
+        - Total Purchase Value (USD)
 $$;